@@ -83,6 +83,15 @@ func _handle_request(client: StreamPeerTCP, request: String) -> void:
 	var method = request_line[0]
 	var path = request_line[1]
 	
+	# Headers, up to the blank line before the body
+	var if_none_match = ""
+	for i in range(1, lines.size()):
+		var line = lines[i]
+		if line.is_empty():
+			break
+		if line.to_lower().begins_with("if-none-match:"):
+			if_none_match = line.substr(line.find(":") + 1).strip_edges()
+	
 	# Extract JSON body
 	var body = ""
 	var body_start = request.find("\r\n\r\n")
@@ -96,7 +105,7 @@ func _handle_request(client: StreamPeerTCP, request: String) -> void:
 			json_data = json.data if json.data is Dictionary else {}
 	
 	var response = _route_request(path.trim_prefix("/"), method, json_data)
-	_send_json_response(client, response)
+	_send_json_response(client, response, if_none_match)
 
 
 func _route_request(path: String, method: String, data: Dictionary) -> Dictionary:
@@ -207,7 +216,9 @@ func _ping() -> Dictionary:
 		"status": "ok",
 		"message": "Claude Bridge connected!",
 		"godot_version": Engine.get_version_info(),
-		"plugin_version": "2.0.0"
+		"plugin_version": "2.1.0",
+		# node/create_many and terrain/heights return per-item results
+		"capabilities": ["batch_results"]
 	}
 
 
@@ -426,12 +437,14 @@ func _create_many_nodes(data: Dictionary) -> Dictionary:
 		return {"error": "Missing nodes array"}
 	
 	var created = []
+	var results = []  # Per node, as returned by node/create
 	for node_data in data["nodes"]:
 		var result = _create_node(node_data)
 		if result.has("path"):
 			created.append(result["path"])
+		results.append(result)
 	
-	return {"created": created, "count": created.size()}
+	return {"created": created, "count": created.size(), "results": results}
 
 
 func _delete_node(data: Dictionary) -> Dictionary:
@@ -744,7 +757,8 @@ func _get_terrain_heights(data: Dictionary) -> Dictionary:
 			results.append({
 				"x": pos[0], "z": pos[1],
 				"height": result.position.y,
-				"normal": _vec3_to_array(result.normal)
+				"normal": _vec3_to_array(result.normal),
+				"position": _vec3_to_array(result.position)
 			})
 		else:
 			results.append({"x": pos[0], "z": pos[1], "height": 0, "hit": false})
@@ -1528,10 +1542,22 @@ func _deserialize_value(value: Variant, hint: Variant = null) -> Variant:
 
 # ============ HTTP Helpers ============
 
-func _send_json_response(client: StreamPeerTCP, data: Dictionary) -> void:
+func _send_json_response(client: StreamPeerTCP, data: Dictionary, if_none_match: String = "") -> void:
 	var json_str = JSON.stringify(data)
+	# Clients revalidate repeated reads with If-None-Match; an unchanged
+	# body is answered with a 304 and not sent again
+	var etag = "\"%s\"" % json_str.md5_text()
+	if if_none_match == etag:
+		var not_modified = "HTTP/1.1 304 Not Modified\r\n"
+		not_modified += "ETag: %s\r\n" % etag
+		not_modified += "Connection: close\r\n"
+		not_modified += "\r\n"
+		client.put_data(not_modified.to_utf8_buffer())
+		return
+	
 	var response = "HTTP/1.1 200 OK\r\n"
 	response += "Content-Type: application/json\r\n"
+	response += "ETag: %s\r\n" % etag
 	response += "Content-Length: %d\r\n" % json_str.length()
 	response += "Access-Control-Allow-Origin: *\r\n"
 	response += "Connection: close\r\n"
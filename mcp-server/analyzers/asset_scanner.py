@@ -12,16 +12,27 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import time
 
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator, see _classify
+    ahocorasick = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # Optional accelerator, see _save_cache/_load_cache
+    orjson = None
+
+
+@dataclass(slots=True)
 class AssetInfo:
     path: str
     type: str  # mesh, texture, scene, audio, material, script, resource
     pack: Optional[str] = None  # Detected asset pack
     category: Optional[str] = None  # trees, ruins, characters, etc.
-    tags: list[str] = field(default_factory=list)
+    tags: frozenset[str] = field(default_factory=frozenset)  # Lowercase
     metadata: dict = field(default_factory=dict)
 
 
@@ -55,6 +66,64 @@ CATEGORY_PATTERNS = {
     "audio": ["sfx", "music", "ambient", "sound"],
 }
 
+# Non-descriptive words dropped from generated tags
+STOP_WORDS = frozenset({
+    'res', 'assets', 'asset', 'models', 'model', 'textures', 'texture',
+    'materials', 'scenes', 'prefabs', 'prefab', 'import', 'source',
+})
+
+# Tag generation patterns. Prefix and suffix stripping share one pass.
+_TAG_AFFIX_RE = re.compile(
+    r'^(?:sm_|sk_|t_|m_|mat_|tex_)|(?:_lod\d+|_\d+|_mat|_diff|_norm|_ao|_rough|_metal)$'
+)
+_TAG_SPLIT_RE = re.compile(r'[_\-\s]')
+_TAG_WORD_RE = re.compile(r'[a-z]+')
+
+
+def _invert_patterns(table: dict[str, list[str]]) -> dict[str, str]:
+    """
+    Invert a name -> keywords table into keyword -> name, in table order.
+    A keyword listed under several names keeps the first one, which is the
+    name an in-order scan of the table would return for it.
+    """
+    inverted = {}
+    for name, patterns in table.items():
+        for pattern in patterns:
+            inverted.setdefault(pattern, name)
+    return inverted
+
+
+PACK_KEYWORD = _invert_patterns(ASSET_PACK_PATTERNS)
+KEYWORD_TO_CATEGORY = _invert_patterns(CATEGORY_PATTERNS)
+_PACK_NAMES = list(ASSET_PACK_PATTERNS)
+_CATEGORY_NAMES = list(CATEGORY_PATTERNS)
+
+
+def _build_keyword_automaton():
+    """
+    Build one Aho-Corasick automaton over every pack and category keyword.
+    Each keyword maps to the (kind, rank) pairs it belongs to, where rank is
+    the position of the pack/category in its table so match priority is
+    the same as scanning the tables in order.
+    """
+    if ahocorasick is None:
+        return None
+    
+    hits = defaultdict(list)
+    for keyword, pack_name in PACK_KEYWORD.items():
+        hits[keyword].append(("pack", _PACK_NAMES.index(pack_name)))
+    for keyword, category in KEYWORD_TO_CATEGORY.items():
+        hits[keyword].append(("category", _CATEGORY_NAMES.index(category)))
+    
+    automaton = ahocorasick.Automaton()
+    for pattern, values in hits.items():
+        automaton.add_word(pattern, tuple(values))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
 # File type mappings
 FILE_TYPE_MAP = {
     # 3D Models
@@ -95,6 +164,63 @@ FILE_TYPE_MAP = {
     # Animation
     ".anim": "animation",
 }
+# First-reject test for the directory walk; everything else is skipped
+_INTERESTING_EXTS = frozenset(FILE_TYPE_MAP)
+
+# Only Windows paths need their separators rewritten for res:// paths
+_NEEDS_SEP_FIX = os.sep != "/"
+
+# Texture type from name suffix keywords, e.g. "rock_diff" or "wall_normal".
+# A keyword matches any "_"-separated token that starts with it; when several
+# tokens match, the type listed first in _TEXTURE_TYPE_ORDER wins.
+_TEXTURE_TYPE_KEYWORDS = {
+    "diff": "diffuse", "albedo": "diffuse", "color": "diffuse", "basecolor": "diffuse",
+    "norm": "normal", "normal": "normal", "nrm": "normal",
+    "rough": "roughness", "roughness": "roughness",
+    "metal": "metallic", "metallic": "metallic",
+    "ao": "ao", "ambient": "ao", "occlusion": "ao",
+    "height": "height", "disp": "height", "displacement": "height",
+    "emiss": "emission", "emission": "emission", "glow": "emission",
+}
+_TEXTURE_TYPE_ORDER = {
+    t: i for i, t in enumerate(
+        ["diffuse", "normal", "roughness", "metallic", "ao", "height", "emission"]
+    )
+}
+_TEXTURE_KEYWORD_LENGTHS = sorted({len(k) for k in _TEXTURE_TYPE_KEYWORDS})
+
+
+def _texture_type(name_lower: str) -> str:
+    """Detect the texture map type from a lowercased file stem."""
+    best = None
+    # Skip the first token: keywords only count after an underscore
+    for token in name_lower.split("_")[1:]:
+        for length in _TEXTURE_KEYWORD_LENGTHS:
+            if length > len(token):
+                break
+            texture_type = _TEXTURE_TYPE_KEYWORDS.get(token[:length])
+            if texture_type and (best is None or _TEXTURE_TYPE_ORDER[texture_type] < _TEXTURE_TYPE_ORDER[best]):
+                best = texture_type
+    return best or "unknown"
+
+
+def _root_mtime_ns(root: str) -> int:
+    """mtime of the project folder, or 0 if it is gone (the walk then finds nothing)."""
+    try:
+        return os.stat(root).st_mtime_ns
+    except OSError:
+        return 0
+
+
+# Worker threads for mesh/scene metadata extraction (I/O bound)
+METADATA_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Scenes larger than this only get size metadata; .tscn files are rarely
+# anywhere near it, so reading them would dominate the scan
+SCENE_METADATA_MAX_BYTES = 2 * 1024 * 1024
+# Works on raw bytes; non-ASCII bytes stand in for Unicode word characters
+# in node names. Godot class names are ASCII.
+_SCENE_ROOT_RE = re.compile(rb'\[node name="(?:\w|[\x80-\xff])+" type="(\w+)"\]')
 
 
 class AssetScanner:
@@ -103,140 +229,255 @@ class AssetScanner:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
         self.cache_file = self.project_path / ".godot" / "claude_asset_cache.json"
-        self.assets: dict[str, AssetInfo] = {}
-        self.categories: dict[str, list[str]] = defaultdict(list)
-        self.packs: dict[str, list[str]] = defaultdict(list)
-        self.by_type: dict[str, list[str]] = defaultdict(list)
+        # Assets are stored column-wise (one list per field, indexed by row)
+        # so filters only touch the fields they test. AssetInfo records are
+        # built on demand, see assets.
+        self._paths: list[str] = []
+        self._types: list[str] = []
+        self._packs: list[Optional[str]] = []
+        self._categories: list[Optional[str]] = []
+        self._tags: list[frozenset[str]] = []
+        self._metadata: list[dict] = []
+        self._rows: dict[str, int] = {}  # path -> row
+        # Inverted indexes: value -> rows, in scan order
+        self.categories: dict[str, list[int]] = defaultdict(list)
+        self.packs: dict[str, list[int]] = defaultdict(list)
+        self.by_type: dict[str, list[int]] = defaultdict(list)
+        self.tag_index: dict[str, list[int]] = defaultdict(list)
         self._scan_time = 0
     
+    @property
+    def assets(self) -> dict[str, AssetInfo]:
+        """All indexed assets by res:// path, materialized as AssetInfo records."""
+        return {path: self._asset_info(row) for path, row in self._rows.items()}
+    
     def scan(self, force: bool = False, exclude_addons: bool = False) -> dict:
         """
         Scan all assets in the project.
         Returns summary statistics.
         """
+        self._clear()
+        
         # Check cache
-        if not force and self._load_cache():
+        if not force and self._load_cache(exclude_addons):
             return self._get_summary()
+        self._clear()
         
         start = time.time()
-        self.assets.clear()
-        self.categories.clear()
-        self.packs.clear()
-        self.by_type.clear()
         
-        # Walk project directory
-        for file_path in self.project_path.rglob("*"):
-            if file_path.is_dir():
-                continue
-            
-            # Skip hidden and Godot internal
-            rel_path = file_path.relative_to(self.project_path)
-            rel_str = str(rel_path)
-            
-            if rel_str.startswith("."):
-                continue
-            if ".godot" in rel_str:
-                continue
-            if exclude_addons and rel_str.startswith("addons"):
-                continue
+        # Walk project directory, fingerprinting it as we go (see _fingerprint)
+        root = str(self.project_path)
+        root_prefix_len = len(os.path.join(root, ""))
+        newest_mtime = _root_mtime_ns(root)
+        
+        def track_dir(dir_entry: os.DirEntry) -> None:
+            nonlocal newest_mtime
+            newest_mtime = max(newest_mtime, dir_entry.stat().st_mtime_ns)
+        
+        pending_metadata: list[tuple[int, str, os.DirEntry]] = []
+        for entry in self._scandir_recursive(root, exclude_addons, on_dir=track_dir,
+                                             exts=_INTERESTING_EXTS):
+            rel_str = entry.path[root_prefix_len:]
+            if _NEEDS_SEP_FIX:
+                rel_str = rel_str.replace(os.sep, "/")
             
-            # Get file type
-            ext = file_path.suffix.lower()
-            asset_type = FILE_TYPE_MAP.get(ext)
+            # Get file type (the walk only yields known extensions)
+            stem, ext = os.path.splitext(entry.name)
+            asset_type = FILE_TYPE_MAP[ext.lower()]
             
-            if not asset_type:
-                continue
+            newest_mtime = max(newest_mtime, entry.stat().st_mtime_ns)
             
-            # Create asset info
-            res_path = f"res://{rel_str.replace(os.sep, '/')}"
-            asset = AssetInfo(
-                path=res_path,
-                type=asset_type
-            )
+            # Lowercase once; every detector below works on these
+            rel_lower = rel_str.lower()
+            stem_lower = stem.lower()
             
-            # Detect asset pack
-            asset.pack = self._detect_pack(rel_str)
+            res_path = f"res://{rel_str}"
             
-            # Detect category
-            asset.category = self._detect_category(rel_str, file_path.stem)
+            # Detect asset pack and category
+            pack, category = self._classify(rel_lower, stem_lower)
             
             # Generate tags
-            asset.tags = self._generate_tags(rel_str, file_path.stem)
+            tags = self._generate_tags(rel_lower, stem_lower)
             
-            # Type-specific metadata
-            if asset_type == "mesh":
-                asset.metadata = self._get_mesh_metadata(file_path)
-            elif asset_type == "scene":
-                asset.metadata = self._get_scene_metadata(file_path)
+            # Type-specific metadata. Meshes and scenes touch the disk, so
+            # they are deferred to the thread pool below.
+            metadata = {}
+            if asset_type in ("mesh", "scene"):
+                pending_metadata.append((len(self._paths), asset_type, entry))
             elif asset_type == "texture":
-                asset.metadata = self._get_texture_metadata(file_path)
+                metadata = self._get_texture_metadata(stem_lower, entry.stat())
             
             # Store asset
-            self.assets[res_path] = asset
-            self.by_type[asset_type].append(res_path)
-            
-            if asset.pack:
-                self.packs[asset.pack].append(res_path)
-            if asset.category:
-                self.categories[asset.category].append(res_path)
+            self._add_asset(res_path, asset_type, pack, category, tags, metadata)
+        
+        # Overlap the file reads of mesh/scene metadata extraction
+        if pending_metadata:
+            with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as pool:
+                results = pool.map(self._extract_metadata, pending_metadata)
+                for (row, _, _), metadata in zip(pending_metadata, results):
+                    self._metadata[row] = metadata
         
         self._scan_time = time.time() - start
-        self._save_cache()
+        self._save_cache(exclude_addons, [len(self._paths), newest_mtime])
         
         return self._get_summary()
     
-    def _detect_pack(self, path: str) -> Optional[str]:
+    def _extract_metadata(self, item: tuple[int, str, os.DirEntry]) -> dict:
+        """Get metadata for a mesh or scene. Safe to run on a worker thread."""
+        _, asset_type, entry = item
+        if asset_type == "mesh":
+            return self._get_mesh_metadata(Path(entry.path), entry.stat())
+        return self._get_scene_metadata(entry.path, entry.stat())
+    
+    def _add_asset(self, path: str, asset_type: str, pack: Optional[str],
+                   category: Optional[str], tags: frozenset[str], metadata: dict) -> None:
+        """Append an asset row and add it to the type/pack/category/tag indexes."""
+        row = len(self._paths)
+        self._paths.append(path)
+        self._types.append(asset_type)
+        self._packs.append(pack)
+        self._categories.append(category)
+        self._tags.append(tags)
+        self._metadata.append(metadata)
+        self._rows[path] = row
+        
+        self.by_type[asset_type].append(row)
+        if pack:
+            self.packs[pack].append(row)
+        if category:
+            self.categories[category].append(row)
+        for tag in tags:
+            self.tag_index[tag].append(row)
+    
+    def _asset_info(self, row: int) -> AssetInfo:
+        """Materialize one asset row as an AssetInfo record."""
+        return AssetInfo(
+            path=self._paths[row],
+            type=self._types[row],
+            pack=self._packs[row],
+            category=self._categories[row],
+            tags=self._tags[row],
+            metadata=self._metadata[row]
+        )
+    
+    def _asset_dict(self, row: int) -> dict:
+        """JSON-ready view of one asset row."""
+        return {
+            "path": self._paths[row],
+            "type": self._types[row],
+            "pack": self._packs[row],
+            "category": self._categories[row],
+            "tags": sorted(self._tags[row]),
+            "metadata": self._metadata[row]
+        }
+    
+    def _clear(self) -> None:
+        """Drop all indexed assets."""
+        for column in (self._paths, self._types, self._packs, self._categories,
+                       self._tags, self._metadata):
+            column.clear()
+        self._rows.clear()
+        self.categories.clear()
+        self.packs.clear()
+        self.by_type.clear()
+        self.tag_index.clear()
+    
+    def _scandir_recursive(self, path: str, exclude_addons: bool = False, depth: int = 0,
+                           on_dir=None, exts: frozenset[str] = None):
+        """
+        Yield file entries below path, reusing the stat info cached by scandir.
+        Hidden entries (including .godot) and optionally the top-level addons
+        folder are pruned here so their subtrees are never opened. on_dir, if
+        given, is called with each directory entry that is descended into.
+        If exts is given, only files with one of those (lowercase) extensions
+        are yielded.
+        """
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if exclude_addons and depth == 0 and name == "addons":
+                            continue
+                        if on_dir is not None:
+                            on_dir(entry)
+                        yield from self._scandir_recursive(entry.path, exclude_addons, depth + 1,
+                                                           on_dir, exts)
+                    elif exts is not None and os.path.splitext(name)[1].lower() not in exts:
+                        continue
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            pass  # Unreadable directory
+    
+    def _classify(self, path_lower: str, filename_lower: str) -> tuple[Optional[str], Optional[str]]:
+        """Detect asset pack and category with a single scan of the lowercased path."""
+        if _KEYWORD_AUTOMATON is None:
+            return self._detect_pack(path_lower), self._detect_category(path_lower, filename_lower)
+        
+        # Pack keywords never contain "/", so scanning the combined string
+        # finds exactly the pack matches _detect_pack would find in path.
+        pack_rank = None
+        category_rank = None
+        for _, hits in _KEYWORD_AUTOMATON.iter(f"{path_lower}/{filename_lower}"):
+            for kind, rank in hits:
+                if kind == "pack":
+                    if pack_rank is None or rank < pack_rank:
+                        pack_rank = rank
+                elif category_rank is None or rank < category_rank:
+                    category_rank = rank
+        
+        pack = _PACK_NAMES[pack_rank] if pack_rank is not None else None
+        category = _CATEGORY_NAMES[category_rank] if category_rank is not None else None
+        return pack, category
+    
+    def _detect_pack(self, path_lower: str) -> Optional[str]:
         """Detect which asset pack this file belongs to."""
-        path_lower = path.lower()
-        for pack_name, patterns in ASSET_PACK_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in path_lower:
-                    return pack_name
+        for keyword, pack_name in PACK_KEYWORD.items():
+            if keyword in path_lower:
+                return pack_name
         return None
     
-    def _detect_category(self, path: str, filename: str) -> Optional[str]:
-        """Detect asset category from path and filename."""
-        combined = f"{path}/{filename}".lower()
-        
-        for category, patterns in CATEGORY_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in combined:
-                    return category
+    def _detect_category(self, path_lower: str, filename_lower: str) -> Optional[str]:
+        """Detect asset category from lowercased path and filename."""
+        combined = f"{path_lower}/{filename_lower}"
+        
+        for keyword, category in KEYWORD_TO_CATEGORY.items():
+            if keyword in combined:
+                return category
         return None
     
-    def _generate_tags(self, path: str, filename: str) -> list[str]:
-        """Generate searchable tags from path and filename."""
+    def _generate_tags(self, path_lower: str, filename_lower: str) -> frozenset[str]:
+        """Generate searchable tags from a lowercased "/"-separated path and filename."""
         tags = set()
         
         # Split path into components
-        parts = path.lower().replace("\\", "/").split("/")
-        parts.append(filename.lower())
+        parts = path_lower.split("/")
+        parts.append(filename_lower)
         
         for part in parts:
             # Remove common prefixes/suffixes
-            clean = re.sub(r'^(sm_|sk_|t_|m_|mat_|tex_)', '', part)
-            clean = re.sub(r'(_lod\d+|_\d+|_mat|_diff|_norm|_ao|_rough|_metal)$', '', clean)
+            clean = _TAG_AFFIX_RE.sub('', part)
             
-            # Split by underscore and camelCase
-            words = re.split(r'[_\-\s]', clean)
-            for word in words:
-                # Also split camelCase
-                camel_split = re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)', word)
-                if camel_split:
-                    tags.update(w.lower() for w in camel_split if len(w) > 2)
+            # Split by underscore/dash/space, then into letter runs. The input
+            # is already lowercase, so camelCase splitting reduces to this.
+            for word in _TAG_SPLIT_RE.split(clean):
+                letter_runs = _TAG_WORD_RE.findall(word)
+                if letter_runs:
+                    tags.update(w for w in letter_runs if len(w) > 2)
                 elif len(word) > 2:
                     tags.add(word)
         
         # Remove common non-descriptive words
-        stop_words = {'res', 'assets', 'asset', 'models', 'model', 'textures', 'texture', 
-                      'materials', 'scenes', 'prefabs', 'prefab', 'import', 'source'}
-        tags -= stop_words
+        tags -= STOP_WORDS
         
-        return list(tags)
+        return frozenset(tags)
     
-    def _get_mesh_metadata(self, file_path: Path) -> dict:
+    def _get_mesh_metadata(self, file_path: Path, stat: os.stat_result) -> dict:
         """Get metadata for mesh files."""
-        metadata = {"size_bytes": file_path.stat().st_size}
+        metadata = {"size_bytes": stat.st_size}
         
         # Check for LOD variants
         stem = file_path.stem
@@ -247,115 +488,121 @@ class AssetScanner:
         
         return metadata
     
-    def _get_scene_metadata(self, file_path: Path) -> dict:
-        """Get metadata for scene files."""
-        metadata = {"size_bytes": file_path.stat().st_size}
+    def _get_scene_metadata(self, file_path: str, stat: os.stat_result) -> dict:
+        """Get metadata for scene files. Oversized scenes are not read."""
+        metadata = {"size_bytes": stat.st_size}
+        if stat.st_size > SCENE_METADATA_MAX_BYTES:
+            return metadata
         
         try:
-            content = file_path.read_text(encoding='utf-8')
+            # Only literal and ASCII matching below, so skip decoding
+            with open(file_path, 'rb') as f:
+                content = f.read(SCENE_METADATA_MAX_BYTES)
             
             # Count nodes
-            node_matches = re.findall(r'\[node name="', content)
-            metadata["node_count"] = len(node_matches)
+            metadata["node_count"] = content.count(b'[node name="')
             
             # Get root type
-            root_match = re.search(r'\[node name="\w+" type="(\w+)"\]', content)
+            root_match = _SCENE_ROOT_RE.search(content)
             if root_match:
-                metadata["root_type"] = root_match.group(1)
+                metadata["root_type"] = root_match.group(1).decode('ascii')
             
             # Check for scripts
-            metadata["has_script"] = 'script = ' in content or '.gd"' in content
+            metadata["has_script"] = b'script = ' in content or b'.gd"' in content
             
         except Exception:
             pass
         
         return metadata
     
-    def _get_texture_metadata(self, file_path: Path) -> dict:
-        """Get metadata for texture files."""
-        metadata = {"size_bytes": file_path.stat().st_size}
+    def _get_texture_metadata(self, name_lower: str, stat: os.stat_result) -> dict:
+        """Get metadata for texture files from the lowercased file stem."""
+        metadata = {"size_bytes": stat.st_size}
         
         # Detect texture type from naming
-        name_lower = file_path.stem.lower()
-        if any(x in name_lower for x in ['_diff', '_albedo', '_color', '_basecolor']):
-            metadata["texture_type"] = "diffuse"
-        elif any(x in name_lower for x in ['_norm', '_normal', '_nrm']):
-            metadata["texture_type"] = "normal"
-        elif any(x in name_lower for x in ['_rough', '_roughness']):
-            metadata["texture_type"] = "roughness"
-        elif any(x in name_lower for x in ['_metal', '_metallic']):
-            metadata["texture_type"] = "metallic"
-        elif any(x in name_lower for x in ['_ao', '_ambient', '_occlusion']):
-            metadata["texture_type"] = "ao"
-        elif any(x in name_lower for x in ['_height', '_disp', '_displacement']):
-            metadata["texture_type"] = "height"
-        elif any(x in name_lower for x in ['_emiss', '_emission', '_glow']):
-            metadata["texture_type"] = "emission"
-        else:
-            metadata["texture_type"] = "unknown"
+        metadata["texture_type"] = _texture_type(name_lower)
         
         return metadata
     
     def _get_summary(self) -> dict:
         """Get scan summary statistics."""
         return {
-            "total_assets": len(self.assets),
+            "total_assets": len(self._paths),
             "by_type": {k: len(v) for k, v in self.by_type.items()},
             "by_pack": {k: len(v) for k, v in self.packs.items()},
             "by_category": {k: len(v) for k, v in self.categories.items()},
             "scan_time_seconds": round(self._scan_time, 2)
         }
     
-    def _save_cache(self) -> None:
-        """Save scan results to cache file."""
+    def _fingerprint(self, exclude_addons: bool) -> list:
+        """
+        Cheap change detector for the asset cache: the number of asset files
+        and the newest mtime among them and every walked folder. Folder mtimes
+        change when entries are added, removed or renamed, so this catches
+        structural changes as well as edits without reading any file.
+        """
+        root = str(self.project_path)
+        newest_mtime = _root_mtime_ns(root)
+        count = 0
+        
+        def track_dir(dir_entry: os.DirEntry) -> None:
+            nonlocal newest_mtime
+            newest_mtime = max(newest_mtime, dir_entry.stat().st_mtime_ns)
+        
+        for entry in self._scandir_recursive(root, exclude_addons, on_dir=track_dir,
+                                             exts=_INTERESTING_EXTS):
+            count += 1
+            newest_mtime = max(newest_mtime, entry.stat().st_mtime_ns)
+        
+        return [count, newest_mtime]
+    
+    def _save_cache(self, exclude_addons: bool, fingerprint: list) -> None:
+        """Save scan results to cache file, one array per asset field."""
         cache_data = {
-            "version": 1,
+            "version": 3,
             "scan_time": self._scan_time,
-            "assets": {
-                path: {
-                    "type": asset.type,
-                    "pack": asset.pack,
-                    "category": asset.category,
-                    "tags": asset.tags,
-                    "metadata": asset.metadata
-                }
-                for path, asset in self.assets.items()
-            }
+            "exclude_addons": exclude_addons,
+            "fingerprint": fingerprint,
+            "paths": self._paths,
+            "types": self._types,
+            "packs": self._packs,
+            "categories": self._categories,
+            "tags": [sorted(tags) for tags in self._tags],
+            "metadata": self._metadata
         }
         
         try:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_file.write_text(json.dumps(cache_data, indent=2))
+            if orjson is not None:
+                payload = orjson.dumps(cache_data)
+            else:
+                payload = json.dumps(cache_data, separators=(",", ":")).encode("utf-8")
+            self.cache_file.write_bytes(payload)
         except Exception:
             pass  # Cache is optional
     
-    def _load_cache(self) -> bool:
-        """Load from cache if valid."""
+    def _load_cache(self, exclude_addons: bool) -> bool:
+        """Load from cache if it was built with the same options and the project is unchanged."""
         if not self.cache_file.exists():
             return False
         
         try:
-            cache_data = json.loads(self.cache_file.read_text())
+            payload = self.cache_file.read_bytes()
+            cache_data = orjson.loads(payload) if orjson is not None else json.loads(payload)
             
-            if cache_data.get("version") != 1:
+            if cache_data.get("version") != 3:
+                return False
+            if cache_data.get("exclude_addons") != exclude_addons:
+                return False
+            if cache_data.get("fingerprint") != self._fingerprint(exclude_addons):
                 return False
             
             # Rebuild from cache
-            for path, data in cache_data["assets"].items():
-                asset = AssetInfo(
-                    path=path,
-                    type=data["type"],
-                    pack=data.get("pack"),
-                    category=data.get("category"),
-                    tags=data.get("tags", []),
-                    metadata=data.get("metadata", {})
-                )
-                self.assets[path] = asset
-                self.by_type[asset.type].append(path)
-                if asset.pack:
-                    self.packs[asset.pack].append(path)
-                if asset.category:
-                    self.categories[asset.category].append(path)
+            columns = zip(cache_data["paths"], cache_data["types"], cache_data["packs"],
+                          cache_data["categories"], cache_data["tags"], cache_data["metadata"],
+                          strict=True)
+            for path, asset_type, pack, category, tags, metadata in columns:
+                self._add_asset(path, asset_type, pack, category, frozenset(tags), metadata)
             
             self._scan_time = cache_data.get("scan_time", 0)
             return True
@@ -374,39 +621,33 @@ class AssetScanner:
                limit: int = 50) -> list[dict]:
         """Search assets with multiple filters."""
         results = []
+        tags_lower = {t.lower() for t in tags} if tags else None
+        query_lower = query.lower() if query else None
         
-        for path, asset in self.assets.items():
+        for row in self._candidates(asset_type, pack, category, tags_lower):
             # Filter by type
-            if asset_type and asset.type != asset_type:
+            if asset_type and self._types[row] != asset_type:
                 continue
             
             # Filter by pack
-            if pack and asset.pack != pack:
+            if pack and self._packs[row] != pack:
                 continue
             
             # Filter by category
-            if category and asset.category != category:
+            if category and self._categories[row] != category:
                 continue
             
             # Filter by tags (all must match)
-            if tags:
-                if not all(t.lower() in asset.tags for t in tags):
-                    continue
+            if tags_lower and not self._tags[row].issuperset(tags_lower):
+                continue
             
             # Filter by query (searches path and tags)
-            if query:
-                query_lower = query.lower()
-                if query_lower not in path.lower() and not any(query_lower in t for t in asset.tags):
+            if query_lower:
+                if (query_lower not in self._paths[row].lower()
+                        and not any(query_lower in t for t in self._tags[row])):
                     continue
             
-            results.append({
-                "path": path,
-                "type": asset.type,
-                "pack": asset.pack,
-                "category": asset.category,
-                "tags": asset.tags,
-                "metadata": asset.metadata
-            })
+            results.append(self._asset_dict(row))
             
             if len(results) >= limit:
                 break
@@ -419,39 +660,68 @@ class AssetScanner:
                    category: str = None,
                    count: int = 1) -> list[str]:
         """Get random assets matching filters."""
-        candidates = []
-        for path, asset in self.assets.items():
-            if asset_type and asset.type != asset_type:
+        if count <= 0:
+            return []
+        
+        # Reservoir sampling (Algorithm R): one pass, O(count) memory
+        reservoir = []
+        seen = 0
+        for row in self._candidates(asset_type, pack, category):
+            if asset_type and self._types[row] != asset_type:
                 continue
-            if pack and asset.pack != pack:
+            if pack and self._packs[row] != pack:
                 continue
-            if category and asset.category != category:
+            if category and self._categories[row] != category:
                 continue
-            candidates.append(path)
+            
+            seen += 1
+            if seen <= count:
+                reservoir.append(row)
+            else:
+                slot = random.randrange(seen)
+                if slot < count:
+                    reservoir[slot] = row
         
-        if not candidates:
-            return []
+        # Shuffle so the order is random too, as with random.sample
+        random.shuffle(reservoir)
+        return [self._paths[row] for row in reservoir]
+    
+    def _candidates(self,
+                    asset_type: str = None,
+                    pack: str = None,
+                    category: str = None,
+                    tags_lower: set[str] = None):
+        """
+        Pick the smallest index row list covering the active filters, so
+        callers only visit assets that can possibly match. Index lists keep
+        scan order, so results come out in the same order as a full scan.
+        Callers still apply every filter to each candidate row.
+        """
+        lists = []
+        if asset_type:
+            lists.append(self.by_type.get(asset_type, ()))
+        if pack:
+            lists.append(self.packs.get(pack, ()))
+        if category:
+            lists.append(self.categories.get(category, ()))
+        if tags_lower:
+            lists.extend(self.tag_index.get(t, ()) for t in tags_lower)
         
-        return random.sample(candidates, min(count, len(candidates)))
+        if not lists:
+            return range(len(self._paths))
+        return min(lists, key=len)
     
     def list_packs(self) -> dict:
         """List all detected asset packs with counts."""
-        return {pack: len(paths) for pack, paths in self.packs.items()}
+        return {pack: len(rows) for pack, rows in self.packs.items()}
     
     def list_categories(self) -> dict:
         """List all categories with counts."""
-        return {cat: len(paths) for cat, paths in self.categories.items()}
+        return {cat: len(rows) for cat, rows in self.categories.items()}
     
     def get_asset(self, path: str) -> Optional[dict]:
         """Get detailed info for a single asset."""
-        asset = self.assets.get(path)
-        if not asset:
+        row = self._rows.get(path)
+        if row is None:
             return None
-        return {
-            "path": asset.path,
-            "type": asset.type,
-            "pack": asset.pack,
-            "category": asset.category,
-            "tags": asset.tags,
-            "metadata": asset.metadata
-        }
+        return self._asset_dict(row)
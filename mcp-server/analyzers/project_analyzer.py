@@ -7,16 +7,119 @@ Works completely offline - no Godot required.
 import os
 import re
 import json
+import time
+import pickle
+import hashlib
+import heapq
+import threading
+from bisect import bisect_left
+from functools import lru_cache, partial
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
-from collections import defaultdict
+from typing import Iterator, Optional
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-from .gdscript_parser import GDScriptParser, GDClass
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator, see _term_matcher
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # Optional linear-time regex engine, see _search_re
+    re2 = None
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator, see _encode_json
+    orjson = None
+
+from .gdscript_parser import GDScriptParser, GDClass, _newline_offsets
 from .tscn_parser import TscnParser, TscnScene
 
 
-@dataclass
+# Persistent parse cache (see _cached_parse). Bump the version whenever the
+# parsers or the cached dataclasses change shape.
+CACHE_VERSION = 7
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 10_000
+# Single-file parses (analyze_script) buffered before the cache is rewritten;
+# scans and save_cache() write it regardless
+CACHE_SAVE_BATCH = 32
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache folder for the parse caches (see ProjectAnalyzer.cache_file)."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return Path(base) / 'mcp-gdot'
+
+# File contents kept in memory between search_in_files calls (LRU)
+SEARCH_BUFFER_CACHE_SIZE = 512
+
+# Encoded analyze_script/analyze_scene responses kept in memory (LRU)
+ANALYSIS_JSON_CACHE_SIZE = 256
+
+# project.godot keys (autoload and input action names)
+_CONFIG_KEY_RE = re.compile(r'\w+')
+
+# Perl classes and word boundaries, which are ASCII-only in RE2
+_PERL_CLASS_RE = re.compile(r'\\[wWbBdDsS]')
+
+
+@lru_cache(maxsize=64)
+def _search_re(pattern: str) -> tuple:
+    """
+    Compiled patterns for search_in_files, matched against whole files:
+    (pattern for ASCII files, pattern for all other files). A bytes pattern
+    matches the raw file, a str pattern the decoded text.
+    User patterns are compiled with RE2 when it is installed: it matches in
+    linear time, so a pattern like (a+)+b cannot hang the server, and it
+    matches UTF-8 bytes directly. Patterns RE2 rejects (backreferences,
+    lookarounds) fall back to re. RE2's \w, \b, \d and \s only know ASCII
+    (and \s leaves out vertical tab), so patterns using them go to re for
+    non-ASCII files, keeping results independent of whether RE2 is installed.
+    With re, ASCII patterns are also compiled as bytes patterns so ASCII
+    files can be searched without decoding them. Only ASCII files: on
+    other text, \w, \b, . and classes would see single UTF-8 bytes instead
+    of characters, and case folding would miss non-ASCII letters.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        try:
+            regex = re2.compile(b'(?m)' + pattern.encode('utf-8'), options)
+        except (re2.error, UnicodeEncodeError):
+            regex = None
+        if regex is not None:
+            if not _PERL_CLASS_RE.search(pattern):
+                return regex, regex
+            try:
+                return regex, re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+            except re.error:
+                return regex, regex  # RE2-only syntax
+    text_re = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    if pattern.isascii():
+        return re.compile(pattern.encode('ascii'), re.IGNORECASE | re.MULTILINE), text_re
+    return text_re, text_re
+
+
+def _encode_json(obj) -> bytes:
+    """Encode an analysis response as indented JSON, with orjson if available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _decode_json(payload: bytes):
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+@dataclass(slots=True)
 class ProjectInfo:
     path: str
     name: str
@@ -28,8 +131,13 @@ class ProjectInfo:
 class ProjectAnalyzer:
     """Analyze entire Godot projects."""
     
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, max_workers: Optional[int] = None):
+        """
+        max_workers sizes the thread pool used to read and parse files;
+        None picks a default from the CPU count and 1 parses sequentially.
+        """
         self.project_path = Path(project_path)
+        self.max_workers = max_workers
         self.gdscript_parser = GDScriptParser()
         self.tscn_parser = TscnParser()
         
@@ -37,6 +145,30 @@ class ProjectAnalyzer:
         self._scripts: dict[str, GDClass] = {}
         self._scenes: dict[str, TscnScene] = {}
         self._project_info: Optional[ProjectInfo] = None
+        
+        # Node indexes over self._scenes, rebuilt by scan_all_scenes. Entries
+        # are (order, scene_path, scene, i) with i the node's position in the
+        # scene columns, ascending in scene/node order.
+        self._nodes_by_type: dict[str, list[tuple]] = defaultdict(list)  # Lowercase type
+        self._nodes_by_group: dict[str, list[tuple]] = defaultdict(list)
+        
+        # Parsed files persisted between sessions, per kind ("scripts" or
+        # "scenes"): relative path -> (mtime_ns, size, digest, cached_at, result).
+        # The cache is a pickle, so it lives in the user's own cache folder,
+        # keyed by the resolved project path, and never inside the project:
+        # a cloned project must not be able to ship one.
+        self._cache_project = str(self.project_path.resolve())
+        cache_key = hashlib.sha256(self._cache_project.encode('utf-8')).hexdigest()[:32]
+        self.cache_file = _user_cache_dir() / f"analyzer_{cache_key}.pkl"
+        self._file_cache: Optional[dict[str, dict[str, tuple]]] = None
+        self._file_cache_changes = 0  # Entries changed since the last save
+        
+        # search_in_files buffers: absolute path -> (mtime_ns, size, content)
+        self._file_buf_cache: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+        self._file_buf_lock = threading.Lock()
+        
+        # Encoded single-file analyses: (kind, relative path) -> (mtime_ns, size, json)
+        self._analysis_json: OrderedDict[tuple[str, str], tuple[int, int, bytes]] = OrderedDict()
     
     def get_project_info(self) -> dict:
         """Get basic project information from project.godot."""
@@ -49,34 +181,47 @@ class ProjectAnalyzer:
         
         content = godot_file.read_text(encoding='utf-8')
         
-        info = ProjectInfo(
-            path=str(self.project_path),
-            name=self._extract_config_value(content, 'config/name') or "Unknown"
-        )
-        
-        # Extract autoloads
-        autoload_section = re.search(r'\[autoload\](.*?)(?=\[|\Z)', content, re.DOTALL)
-        if autoload_section:
-            for match in re.finditer(r'(\w+)="?\*?res://(.+?)"?$', autoload_section.group(1), re.MULTILINE):
-                info.autoloads.append({
-                    "name": match.group(1),
-                    "path": f"res://{match.group(2)}"
-                })
+        info = ProjectInfo(path=str(self.project_path), name="Unknown")
+        name = None
         
-        # Extract input actions
-        input_section = re.search(r'\[input\](.*?)(?=\[|\Z)', content, re.DOTALL)
-        if input_section:
-            for match in re.finditer(r'^(\w+)=', input_section.group(1), re.MULTILINE):
-                info.input_actions.append(match.group(1))
+        # Single pass over the file, tracking the current [section]. Only
+        # header lines switch sections, so "[" inside multi-line values
+        # (input events) does not cut a section short.
+        section = None
+        for line in content.splitlines():
+            if line.startswith('[') and line.endswith(']') and line[1:-1].isidentifier():
+                section = line[1:-1]
+                continue
+            
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            key = key.strip()
+            
+            if key == 'config/name' and name is None:
+                # First quoted value wins
+                if value.startswith('"'):
+                    end = value.find('"', 1)
+                    if end > 1:
+                        name = value[1:end]
+            
+            elif section == 'autoload' and _CONFIG_KEY_RE.fullmatch(key):
+                # Name="*res://path.gd", "*" marking a singleton
+                path = value.strip()
+                path = path[1:] if path.startswith('"') else path
+                path = path[:-1] if path.endswith('"') else path
+                path = path[1:] if path.startswith('*') else path
+                if path.startswith('res://') and len(path) > len('res://'):
+                    info.autoloads.append({"name": key, "path": path})
+            
+            elif section == 'input' and _CONFIG_KEY_RE.fullmatch(key):
+                info.input_actions.append(key)
         
+        if name:
+            info.name = name
         self._project_info = info
         return self._info_to_dict(info)
     
-    def _extract_config_value(self, content: str, key: str) -> Optional[str]:
-        """Extract a config value from project.godot."""
-        match = re.search(rf'{key}="(.+?)"', content)
-        return match.group(1) if match else None
-    
     def _info_to_dict(self, info: ProjectInfo) -> dict:
         return {
             "path": info.path,
@@ -85,17 +230,250 @@ class ProjectAnalyzer:
             "input_actions": info.input_actions
         }
     
-    def scan_all_scripts(self) -> list[dict]:
-        """Scan and parse all GDScript files in the project."""
-        scripts = []
-        for gd_file in self.project_path.rglob("*.gd"):
-            # Skip addons unless specifically requested
-            rel_path = gd_file.relative_to(self.project_path)
+    def _scandir_recursive(self, path: str, suffixes: tuple[str, ...], root_prefix_len: int = 0,
+                           on_dir=None):
+        """
+        Yield (entry, relative path) for files below path whose name ends
+        with one of suffixes, reusing the type info cached by scandir instead
+        of building Path objects. Like rglob, symlinked folders are not
+        descended into and a folder's files come before its subfolders'.
+        on_dir, if given, is called with each directory entry descended into.
+        """
+        if not root_prefix_len:
+            root_prefix_len = len(os.path.join(path, ""))
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+                    elif entry.name.endswith(suffixes) and entry.is_file():
+                        yield entry, entry.path[root_prefix_len:]
+        except OSError:
+            pass  # Unreadable directory
+        for subdir in subdirs:
+            if on_dir is not None:
+                on_dir(subdir)
+            yield from self._scandir_recursive(subdir.path, suffixes, root_prefix_len, on_dir)
+    
+    def fingerprint(self) -> tuple[int, int, int]:
+        """
+        Cheap change detector for scan results: the number of scripts and
+        scenes, their total size and the newest mtime among them, every
+        walked folder and project.godot. Folder mtimes change when entries are
+        added, removed or renamed, so this catches structural changes as well
+        as edits without reading any file. Hidden folders such as .godot are
+        churned by the editor, so only their files count.
+        """
+        root = str(self.project_path)
+        try:
+            newest_mtime = os.stat(root).st_mtime_ns
+        except OSError:
+            newest_mtime = 0  # Project folder gone; the walk finds nothing
+        count = 0
+        total_size = 0
+        
+        def track_dir(dir_entry: os.DirEntry) -> None:
+            nonlocal newest_mtime
+            if not dir_entry.name.startswith("."):
+                newest_mtime = max(newest_mtime, dir_entry.stat(follow_symlinks=False).st_mtime_ns)
+        
+        for entry, _ in self._scandir_recursive(root, (".gd", ".tscn", "project.godot"), on_dir=track_dir):
+            st = entry.stat()
+            count += 1
+            total_size += st.st_size
+            newest_mtime = max(newest_mtime, st.st_mtime_ns)
+        
+        return count, total_size, newest_mtime
+    
+    def _load_file_cache(self) -> dict[str, dict[str, tuple]]:
+        """Load the persistent parse cache, starting empty if it is missing or stale."""
+        if self._file_cache is not None:
+            return self._file_cache
+        
+        self._file_cache = {"scripts": {}, "scenes": {}}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                # Only unpickle files written by this user that nobody else
+                # can modify
+                st = os.fstat(f.fileno())
+                if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+                    return self._file_cache
+                cache_data = pickle.load(f)
+            if cache_data.get("version") == CACHE_VERSION and cache_data.get("project") == self._cache_project:
+                self._file_cache["scripts"] = cache_data["scripts"]
+                self._file_cache["scenes"] = cache_data["scenes"]
+        except Exception:
+            pass  # Cache is optional
+        return self._file_cache
+    
+    def _save_file_cache(self) -> None:
+        """Persist the parse cache, dropping expired and the oldest excess entries."""
+        if not self._file_cache_changes:
+            return
+        
+        cutoff = time.time() - CACHE_TTL_SECONDS
+        entries = []
+        for kind, cache in self._file_cache.items():
+            for rel_path, cached in list(cache.items()):
+                if cached[3] < cutoff:
+                    del cache[rel_path]
+                else:
+                    entries.append((cached[3], kind, rel_path))
+        if len(entries) > CACHE_MAX_ENTRIES:
+            entries.sort()
+            for _, kind, rel_path in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+                del self._file_cache[kind][rel_path]
+        
+        try:
+            self.cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache_data = {"version": CACHE_VERSION, "project": self._cache_project, **self._file_cache}
+            # Written privately, then moved into place so readers never see
+            # a partial file
+            tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pickle.dumps(cache_data, pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, self.cache_file)
+            self._file_cache_changes = 0
+        except Exception:
+            pass  # Cache is optional
+    
+    def save_cache(self) -> None:
+        """Write out parse cache changes not persisted yet, e.g. at shutdown."""
+        if self._file_cache is not None:
+            self._save_file_cache()
+    
+    def _cached_parse(self, kind: str, path: str, st: os.stat_result, rel_path: str,
+                      parse_content, invalidate: bool = False) -> tuple:
+        """
+        Parse a file through the persistent cache. An unchanged mtime and size
+        reuse the cached result without reading the file. Otherwise the file
+        is read and its content hash compared, so touched-but-identical files
+        are not re-parsed either. Entries older than CACHE_TTL_SECONDS are
+        always re-parsed. parse_content gets the raw bytes of the file.
+        Returns (result, cache entry), the entry being None when the cached
+        one is still current. The cache is only read here, so this is safe
+        on worker threads; the caller stores the entry (_remember_parse).
+        """
+        cache = self._load_file_cache()[kind]
+        now = time.time()
+        
+        cached = cache.get(rel_path)
+        if invalidate or (cached and now - cached[3] >= CACHE_TTL_SECONDS):
+            cached = None
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[4], None
+        
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if cached and cached[2] == digest:
+            result = cached[4]
+        else:
+            # Same newline handling as read_text()
+            content = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            result = parse_content(content, path)
+        
+        return result, (st.st_mtime_ns, st.st_size, digest, now, result)
+    
+    def _remember_parse(self, kind: str, rel_path: str, cache_entry: Optional[tuple]) -> None:
+        """Store a cache entry returned by _cached_parse, on the calling thread."""
+        if cache_entry is not None:
+            self._load_file_cache()[kind][rel_path] = cache_entry
+            self._file_cache_changes += 1
+    
+    def _forget_missing(self, kind: str, seen: set[str]) -> None:
+        """Drop cached parses of files that no longer exist after a full scan."""
+        cache = self._load_file_cache()[kind]
+        for rel_path in cache.keys() - seen:
+            del cache[rel_path]
+            self._file_cache_changes += 1
+    
+    def _map_files(self, func, files: list) -> list:
+        """Apply func to every file on the thread pool, keeping file order."""
+        if self.max_workers == 1 or len(files) < 2:
+            return [func(item) for item in files]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(func, files))
+    
+    def _parse_files(self, kinds: tuple[str, ...], invalidate: bool) -> dict[str, list[tuple]]:
+        """
+        Parse every project file of the given kinds ("scripts", "scenes") in
+        a single traversal, in parallel. Returns, per kind, (rel_path,
+        result, error) per file in walk order; exactly one of result and
+        error is None.
+        """
+        # suffix -> (kind, parse_content). Scene scans only keep structure;
+        # analyze_scene parses properties.
+        parsers = {
+            ".gd": ("scripts", self._parse_script_data),
+            ".tscn": ("scenes", partial(self.tscn_parser.parse_content, parse_properties=False)),
+        }
+        parsers = {suffix: spec for suffix, spec in parsers.items() if spec[0] in kinds}
+        files = list(self._scandir_recursive(str(self.project_path), tuple(parsers)))
+        self._load_file_cache()  # Load once, before the workers share it
+        
+        def parse(item: tuple[os.DirEntry, str]) -> tuple:
+            entry, rel_path = item
+            kind, parse_content = next(
+                spec for suffix, spec in parsers.items() if entry.name.endswith(suffix)
+            )
             try:
-                gd_class = self.gdscript_parser.parse_file(gd_file)
-                self._scripts[str(rel_path)] = gd_class
+                result, cache_entry = self._cached_parse(kind, entry.path, entry.stat(), rel_path,
+                                                         parse_content, invalidate)
+                return kind, rel_path, result, cache_entry, None
+            except Exception as e:
+                return kind, rel_path, None, None, e
+        
+        # Workers only parse; the cache is updated here, on this thread
+        parsed: dict[str, list[tuple]] = {kind: [] for kind, _ in parsers.values()}
+        for kind, rel_path, result, cache_entry, error in self._map_files(parse, files):
+            self._remember_parse(kind, rel_path, cache_entry)
+            parsed[kind].append((rel_path, result, error))
+        for kind, results in parsed.items():
+            self._forget_missing(kind, {rel_path for rel_path, _, _ in results})
+        self._save_file_cache()
+        return parsed
+    
+    def _parse_script_data(self, data: bytes, path: str) -> GDClass:
+        """Parse raw GDScript bytes; the GDScript parser works on text."""
+        return self.gdscript_parser.parse_content(data.decode('utf-8'), path)
+    
+    def scan_all(self, invalidate: bool = False) -> dict:
+        """
+        Scan and parse all scripts and scenes in one walk of the project.
+        Returns the scan_all_scripts and scan_all_scenes results.
+        """
+        parsed = self._parse_files(("scripts", "scenes"), invalidate)
+        return {
+            "scripts": self._store_scripts(parsed["scripts"]),
+            "scenes": self._store_scenes(parsed["scenes"])
+        }
+    
+    def scan_all_scripts(self, invalidate: bool = False) -> list[dict]:
+        """
+        Scan and parse all GDScript files in the project.
+        Unchanged files come from the parse cache unless invalidate is set.
+        """
+        return self._store_scripts(self._parse_files(("scripts",), invalidate)["scripts"])
+    
+    def scan_all_scenes(self, invalidate: bool = False) -> list[dict]:
+        """
+        Scan and parse all scene files in the project.
+        Unchanged files come from the parse cache unless invalidate is set.
+        Only scene structure is kept; analyze_scene parses properties.
+        """
+        return self._store_scenes(self._parse_files(("scenes",), invalidate)["scenes"])
+    
+    def _store_scripts(self, parsed: list[tuple]) -> list[dict]:
+        """Keep parsed scripts and summarize them for scan results."""
+        scripts = []
+        for rel_path, gd_class, error in parsed:
+            if gd_class is not None:
+                self._scripts[rel_path] = gd_class
                 scripts.append({
-                    "path": str(rel_path),
+                    "path": rel_path,
                     "class_name": gd_class.name,
                     "extends": gd_class.extends,
                     "is_tool": gd_class.is_tool,
@@ -103,155 +481,211 @@ class ProjectAnalyzer:
                     "signal_count": len(gd_class.signals),
                     "export_count": len(gd_class.exports)
                 })
-            except Exception as e:
+            else:
                 scripts.append({
-                    "path": str(rel_path),
-                    "error": str(e)
+                    "path": rel_path,
+                    "error": str(error)
                 })
         return scripts
     
-    def scan_all_scenes(self) -> list[dict]:
-        """Scan and parse all scene files in the project."""
+    def _store_scenes(self, parsed: list[tuple]) -> list[dict]:
+        """Keep parsed scenes, summarize them and rebuild the node indexes."""
         scenes = []
-        for tscn_file in self.project_path.rglob("*.tscn"):
-            rel_path = tscn_file.relative_to(self.project_path)
-            try:
-                scene = self.tscn_parser.parse_file(tscn_file)
-                self._scenes[str(rel_path)] = scene
+        for rel_path, scene, error in parsed:
+            if scene is not None:
+                self._scenes[rel_path] = scene
                 scenes.append({
-                    "path": str(rel_path),
+                    "path": rel_path,
                     "root_type": scene.root_node.type if scene.root_node else None,
                     "node_count": len(scene.nodes),
                     "connection_count": len(scene.connections),
                     "external_resources": len(scene.ext_resources)
                 })
-            except Exception as e:
+            else:
                 scenes.append({
-                    "path": str(rel_path),
-                    "error": str(e)
+                    "path": rel_path,
+                    "error": str(error)
                 })
+        
+        self._index_nodes()
         return scenes
     
+    def _index_nodes(self) -> None:
+        """Rebuild the type and group indexes from the parsed scenes."""
+        self._nodes_by_type.clear()
+        self._nodes_by_group.clear()
+        order = 0
+        for scene_path, scene in self._scenes.items():
+            for i, node_type in enumerate(scene.types):
+                item = (order, scene_path, scene, i)
+                order += 1
+                if node_type:
+                    self._nodes_by_type[node_type.lower()].append(item)
+                for group in scene.groups[i]:
+                    self._nodes_by_group[group].append(item)
+    
     def find_nodes_by_type(self, node_type: str) -> list[dict]:
         """Find all nodes of a specific type across all scenes."""
+        return list(self.iter_nodes_by_type(node_type))
+    
+    def iter_nodes_by_type(self, node_type: str) -> Iterator[dict]:
+        """
+        Yield find_nodes_by_type results one at a time, so callers that stop
+        early (e.g. with itertools.islice) don't build the whole list.
+        """
         if not self._scenes:
             self.scan_all_scenes()
         
-        results = []
-        for scene_path, scene in self._scenes.items():
-            for node in scene.nodes:
-                if node.type and node_type.lower() in node.type.lower():
-                    results.append({
-                        "scene": scene_path,
-                        "node_name": node.name,
-                        "node_type": node.type,
-                        "parent": node.parent,
-                        "groups": node.groups
-                    })
-        return results
+        # Substring match over the (few) distinct types, then merge their
+        # buckets back into scene order
+        type_lower = node_type.lower()
+        buckets = [items for key, items in self._nodes_by_type.items() if type_lower in key]
+        for _, scene_path, scene, i in heapq.merge(*buckets, key=lambda item: item[0]):
+            yield {
+                "scene": scene_path,
+                "node_name": scene.names[i],
+                "node_type": scene.types[i],
+                "parent": scene.parents[i],
+                "groups": sorted(scene.groups[i])
+            }
     
     def find_nodes_by_group(self, group_name: str) -> list[dict]:
         """Find all nodes in a specific group across all scenes."""
+        return list(self.iter_nodes_by_group(group_name))
+    
+    def iter_nodes_by_group(self, group_name: str) -> Iterator[dict]:
+        """Yield find_nodes_by_group results one at a time."""
         if not self._scenes:
             self.scan_all_scenes()
         
-        results = []
-        for scene_path, scene in self._scenes.items():
-            for node in scene.nodes:
-                if group_name in node.groups:
-                    results.append({
-                        "scene": scene_path,
-                        "node_name": node.name,
-                        "node_type": node.type,
-                        "groups": node.groups
-                    })
-        return results
+        for _, scene_path, scene, i in self._nodes_by_group.get(group_name, ()):
+            yield {
+                "scene": scene_path,
+                "node_name": scene.names[i],
+                "node_type": scene.types[i],
+                "groups": sorted(scene.groups[i])
+            }
     
     def find_script_usages(self, search_term: str) -> list[dict]:
         """Search for a term across all scripts (function names, variables, etc)."""
+        return list(self.iter_script_usages(search_term))
+    
+    def iter_script_usages(self, search_term: str) -> Iterator[dict]:
+        """Yield find_script_usages results one script at a time."""
+        for script_path, matches in self._iter_usages([search_term]):
+            yield {
+                "script": script_path,
+                "matches": matches[search_term]
+            }
+    
+    def find_script_usages_many(self, search_terms: list[str]) -> dict[str, list[dict]]:
+        """
+        Search for several terms across all scripts in one pass over the
+        symbols. Returns, per term, the same result list as
+        find_script_usages.
+        """
+        usages: dict[str, list[dict]] = {term: [] for term in search_terms}
+        for script_path, matches in self._iter_usages(search_terms):
+            for term, term_matches in matches.items():
+                usages[term].append({
+                    "script": script_path,
+                    "matches": term_matches
+                })
+        return usages
+    
+    def _iter_usages(self, search_terms: list[str]) -> Iterator[tuple[str, dict[str, list[dict]]]]:
+        """Yield (script_path, matches per term) for every script matching any term."""
         if not self._scripts:
             self.scan_all_scripts()
         
-        results = []
-        search_lower = search_term.lower()
+        matcher = self._term_matcher(search_terms)
         
         for script_path, gd_class in self._scripts.items():
-            matches = []
+            matches: dict[str, list[dict]] = defaultdict(list)
             
             # Check class name
-            if gd_class.name and search_lower in gd_class.name.lower():
-                matches.append({"type": "class_name", "name": gd_class.name})
-            
-            # Check functions
-            for func in gd_class.functions:
-                if search_lower in func.name.lower():
-                    matches.append({
-                        "type": "function",
-                        "name": func.name,
-                        "line": func.line
-                    })
-            
-            # Check signals
-            for sig in gd_class.signals:
-                if search_lower in sig.name.lower():
-                    matches.append({
-                        "type": "signal",
-                        "name": sig.name,
-                        "line": sig.line
-                    })
-            
-            # Check exports
-            for exp in gd_class.exports:
-                if search_lower in exp.name.lower():
-                    matches.append({
-                        "type": "export",
-                        "name": exp.name,
-                        "line": exp.line
-                    })
+            if gd_class.name:
+                for term in matcher(gd_class.name.lower()):
+                    matches[term].append({"type": "class_name", "name": gd_class.name})
             
-            # Check variables
-            for var in gd_class.variables:
-                if search_lower in var.name.lower():
-                    matches.append({
-                        "type": "variable",
-                        "name": var.name,
-                        "line": var.line
-                    })
+            # Check functions, signals, exports and variables
+            for match_type, symbols in (("function", gd_class.functions),
+                                        ("signal", gd_class.signals),
+                                        ("export", gd_class.exports),
+                                        ("variable", gd_class.variables)):
+                for symbol in symbols:
+                    for term in matcher(symbol._name_lower):
+                        matches[term].append({
+                            "type": match_type,
+                            "name": symbol.name,
+                            "line": symbol.line
+                        })
             
             if matches:
-                results.append({
-                    "script": script_path,
-                    "matches": matches
-                })
+                yield script_path, matches
+    
+    def _term_matcher(self, search_terms: list[str]):
+        """
+        Return a function mapping a lowercased name to the search terms it
+        contains (case-insensitively), each at most once. Several terms are
+        matched in one pass with an Aho-Corasick automaton when available.
+        """
+        by_lower: dict[str, list[str]] = defaultdict(list)
+        for term in dict.fromkeys(search_terms):
+            by_lower[term.lower()].append(term)
         
-        return results
+        if len(by_lower) == 1:
+            (term_lower, terms), = by_lower.items()
+            return lambda name_lower: terms if term_lower in name_lower else ()
+        
+        if ahocorasick is None or "" in by_lower:
+            def match(name_lower: str) -> list[str]:
+                return [term for term_lower, terms in by_lower.items()
+                        if term_lower in name_lower for term in terms]
+            return match
+        
+        automaton = ahocorasick.Automaton()
+        for term_lower, terms in by_lower.items():
+            automaton.add_word(term_lower, terms)
+        automaton.make_automaton()
+        
+        def match(name_lower: str) -> list[str]:
+            found = {}
+            for _, terms in automaton.iter(name_lower):
+                for term in terms:
+                    found[term] = None
+            return list(found)
+        return match
     
     def find_signal_connections(self, signal_name: str) -> list[dict]:
         """Find all connections for a specific signal across scenes."""
+        return list(self.iter_signal_connections(signal_name))
+    
+    def iter_signal_connections(self, signal_name: str) -> Iterator[dict]:
+        """Yield find_signal_connections results one at a time."""
         if not self._scenes:
             self.scan_all_scenes()
         
-        results = []
         signal_lower = signal_name.lower()
         
         for scene_path, scene in self._scenes.items():
             for conn in scene.connections:
                 if signal_lower in conn.signal.lower():
-                    results.append({
+                    yield {
                         "scene": scene_path,
                         "signal": conn.signal,
                         "from_node": conn.from_node,
                         "to_node": conn.to_node,
                         "method": conn.method
-                    })
-        
-        return results
+                    }
     
     def get_dependency_graph(self) -> dict:
         """Build a dependency graph of all scripts and scenes."""
-        if not self._scripts:
+        if not self._scripts and not self._scenes:
+            self.scan_all()
+        elif not self._scripts:
             self.scan_all_scripts()
-        if not self._scenes:
+        elif not self._scenes:
             self.scan_all_scenes()
         
         dependencies = defaultdict(list)
@@ -263,15 +697,14 @@ class ProjectAnalyzer:
         
         # Scene dependencies (external resources, instances)
         for scene_path, scene in self._scenes.items():
+            key = f"res://{scene_path}"
             for res in scene.ext_resources:
                 if res.path:
-                    dependencies[f"res://{scene_path}"].append(res.path)
+                    dependencies[key].append(res.path)
             for node in scene.nodes:
-                if node.instance:
-                    # Find the actual path from ext_resources
-                    for res in scene.ext_resources:
-                        if res.id == node.instance:
-                            dependencies[f"res://{scene_path}"].append(res.path)
+                # Find the actual path from ext_resources
+                if node.instance and (res := scene.ext_by_id.get(node.instance)) and res.path:
+                    dependencies[key].append(res.path)
         
         return dict(dependencies)
     
@@ -305,52 +738,140 @@ class ProjectAnalyzer:
             "orphaned_scenes": list(orphaned_scenes)
         }
     
-    def analyze_script(self, script_path: str) -> dict:
-        """Get detailed analysis of a single script."""
-        full_path = self.project_path / script_path
-        if not full_path.exists():
-            return {"error": f"Script not found: {script_path}"}
+    def _cached_analysis_json(self, kind: str, rel_path: str, analyze) -> Optional[bytes]:
+        """
+        JSON encoding of analyze(full_path) for a single file, reused while
+        the file's mtime and size are unchanged. Returns None if the file
+        does not exist.
+        """
+        full_path = self.project_path / rel_path
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return None
         
-        gd_class = self.gdscript_parser.parse_file(full_path)
+        key = (kind, rel_path)
+        cached = self._analysis_json.get(key)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            self._analysis_json.move_to_end(key)
+            return cached[2]
+        
+        encoded = _encode_json(analyze(full_path))
+        self._analysis_json[key] = (st.st_mtime_ns, st.st_size, encoded)
+        self._analysis_json.move_to_end(key)
+        while len(self._analysis_json) > ANALYSIS_JSON_CACHE_SIZE:
+            self._analysis_json.popitem(last=False)
+        return encoded
+    
+    def _analyze_script_file(self, full_path: Path) -> dict:
+        # Scripts are parsed in full by scans too, so share their persistent
+        # cache: a script scanned in an earlier session is not re-parsed
+        rel_path = os.path.normpath(os.path.relpath(full_path, self.project_path))
+        gd_class, cache_entry = self._cached_parse("scripts", str(full_path), os.stat(full_path), rel_path,
+                                                   self._parse_script_data)
+        self._remember_parse("scripts", rel_path, cache_entry)
+        if self._file_cache_changes >= CACHE_SAVE_BATCH:
+            self._save_file_cache()
         return self.gdscript_parser.to_dict(gd_class)
     
-    def analyze_scene(self, scene_path: str) -> dict:
-        """Get detailed analysis of a single scene."""
-        full_path = self.project_path / scene_path
-        if not full_path.exists():
-            return {"error": f"Scene not found: {scene_path}"}
-        
+    def _analyze_scene_file(self, full_path: Path) -> dict:
         scene = self.tscn_parser.parse_file(full_path)
         result = self.tscn_parser.to_dict(scene)
         result["node_tree"] = self.tscn_parser.get_node_tree(scene)
         return result
     
+    def analyze_script_json(self, script_path: str) -> bytes:
+        """analyze_script as encoded JSON, cached until the script changes."""
+        encoded = self._cached_analysis_json("script", script_path, self._analyze_script_file)
+        if encoded is None:
+            return _encode_json({"error": f"Script not found: {script_path}"})
+        return encoded
+    
+    def analyze_scene_json(self, scene_path: str) -> bytes:
+        """analyze_scene as encoded JSON, cached until the scene changes."""
+        encoded = self._cached_analysis_json("scene", scene_path, self._analyze_scene_file)
+        if encoded is None:
+            return _encode_json({"error": f"Scene not found: {scene_path}"})
+        return encoded
+    
+    def analyze_script(self, script_path: str) -> dict:
+        """Get detailed analysis of a single script."""
+        return _decode_json(self.analyze_script_json(script_path))
+    
+    def analyze_scene(self, scene_path: str) -> dict:
+        """Get detailed analysis of a single scene."""
+        return _decode_json(self.analyze_scene_json(scene_path))
+    
+    def _read_search_buffer(self, entry: os.DirEntry) -> bytes:
+        """
+        Newline-normalized content of a file for search_in_files. Files whose
+        mtime and size are unchanged are served from an in-memory LRU instead
+        of being opened again. Called from worker threads.
+        """
+        st = entry.stat()
+        key = entry.path
+        with self._file_buf_lock:
+            cached = self._file_buf_cache.get(key)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                self._file_buf_cache.move_to_end(key)
+                return cached[2]
+        
+        with open(key, 'rb') as f:
+            content = f.read()
+        # Same newline handling as text mode
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        with self._file_buf_lock:
+            self._file_buf_cache[key] = (st.st_mtime_ns, st.st_size, content)
+            self._file_buf_cache.move_to_end(key)
+            while len(self._file_buf_cache) > SEARCH_BUFFER_CACHE_SIZE:
+                self._file_buf_cache.popitem(last=False)
+        return content
+    
     def search_in_files(self, pattern: str, file_types: list[str] = None) -> list[dict]:
         """Search for a regex pattern across project files."""
         if file_types is None:
             file_types = [".gd", ".tscn", ".tres"]
         
-        results = []
-        regex = re.compile(pattern, re.IGNORECASE)
-        
-        for file_type in file_types:
-            for file_path in self.project_path.rglob(f"*{file_type}"):
-                rel_path = file_path.relative_to(self.project_path)
-                try:
-                    content = file_path.read_text(encoding='utf-8')
-                    matches = []
-                    for i, line in enumerate(content.split('\n'), 1):
-                        if regex.search(line):
-                            matches.append({
-                                "line": i,
-                                "content": line.strip()[:200]  # Truncate long lines
-                            })
-                    if matches:
-                        results.append({
-                            "file": str(rel_path),
-                            "matches": matches
-                        })
-                except Exception as e:
-                    pass  # Skip unreadable files
+        ascii_regex, text_regex = _search_re(pattern)
+        
+        def search_file(item: tuple[os.DirEntry, str]) -> Optional[dict]:
+            entry, rel_path = item
+            try:
+                content = self._read_search_buffer(entry)
+                regex = ascii_regex if content.isascii() else text_regex
+                search_bytes = isinstance(regex.pattern, bytes)
+                if not search_bytes:
+                    content = content.decode('utf-8')
+            except Exception:
+                return None  # Skip unreadable files
+            # Search the whole buffer and map hits to lines, instead of
+            # splitting the file and searching every line separately
+            newlines = _newline_offsets(content)
+            matches = []
+            pos = 0
+            while pos <= len(content):
+                match = regex.search(content, pos)
+                if not match:
+                    break
+                line_no = bisect_left(newlines, match.start()) + 1
+                line_start = newlines[line_no - 2] + 1 if line_no > 1 else 0
+                line_end = newlines[line_no - 1] if line_no <= len(newlines) else len(content)
+                line = content[line_start:line_end]
+                # A hit spanning lines only counts if the line matches on its own
+                if match.end() <= line_end or regex.search(line):
+                    if search_bytes:
+                        line = line.decode('utf-8', 'replace')
+                    matches.append({
+                        "line": line_no,
+                        "content": line.strip()[:200]  # Truncate long lines
+                    })
+                # One entry per line: continue on the next line
+                pos = line_end + 1
+            if not matches:
+                return None
+            return {"file": rel_path, "matches": matches}
         
-        return results
+        # One traversal for all file types, files searched in parallel
+        files = list(self._scandir_recursive(str(self.project_path), tuple(file_types)))
+        return [result for result in self._map_files(search_file, files) if result]
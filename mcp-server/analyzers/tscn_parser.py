@@ -7,10 +7,16 @@ Works completely offline - no Godot required.
 import re
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Any
 
 
-@dataclass
+def _decode(value: Optional[bytes]) -> Optional[str]:
+    """Decode a captured field; the file itself is never decoded as a whole."""
+    return value.decode('utf-8') if value is not None else None
+
+
+@dataclass(slots=True)
 class TscnResource:
     id: str
     type: str
@@ -18,18 +24,18 @@ class TscnResource:
     properties: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TscnNode:
     name: str
     type: Optional[str] = None
     parent: Optional[str] = None
     instance: Optional[str] = None  # For instanced scenes
     properties: dict = field(default_factory=dict)
-    groups: list[str] = field(default_factory=list)
+    groups: frozenset[str] = field(default_factory=frozenset)
     children: list['TscnNode'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TscnConnection:
     signal: str
     from_node: str
@@ -38,7 +44,7 @@ class TscnConnection:
     flags: int = 0
 
 
-@dataclass
+@dataclass  # No slots: cached_property needs the instance __dict__
 class TscnScene:
     path: str
     format_version: int = 3
@@ -48,136 +54,174 @@ class TscnScene:
     nodes: list[TscnNode] = field(default_factory=list)
     connections: list[TscnConnection] = field(default_factory=list)
     root_node: Optional[TscnNode] = None
+    # Per-node columns, parallel to nodes, for filters that only look at a
+    # few fields (see ProjectAnalyzer.find_nodes_by_type)
+    types: list[Optional[str]] = field(default_factory=list, repr=False)
+    names: list[str] = field(default_factory=list, repr=False)
+    parents: list[Optional[str]] = field(default_factory=list, repr=False)
+    groups: list[frozenset[str]] = field(default_factory=list, repr=False)
+    
+    # Built on first use (see ProjectAnalyzer.get_dependency_graph). Scenes
+    # are not modified after parsing, so it never needs invalidating.
+    @cached_property
+    def ext_by_id(self) -> dict[str, TscnResource]:
+        """External resources by id; the first declaration of an id wins."""
+        return {r.id: r for r in reversed(self.ext_resources)}
 
 
 class TscnParser:
     """Parse Godot .tscn scene files."""
     
-    # Patterns for parsing TSCN format
+    # Patterns for parsing TSCN format. They only anchor on ASCII, so they
+    # run on the raw file bytes.
     HEADER_PATTERN = re.compile(
-        r'\[gd_scene.*?format=(\d+).*?\]'
+        rb'\[gd_scene.*?format=(\d+).*?\]'
     )
     EXT_RESOURCE_PATTERN = re.compile(
-        r'\[ext_resource\s+type="([^"]+)"\s+(?:uid="([^"]+)"\s+)?path="([^"]+)"\s+id="([^"]+)"\]'
+        rb'\[ext_resource\s+type="([^"]+)"\s+(?:uid="([^"]+)"\s+)?path="([^"]+)"\s+id="([^"]+)"\]'
     )
     SUB_RESOURCE_PATTERN = re.compile(
-        r'\[sub_resource\s+type="([^"]+)"\s+id="([^"]+)"\]'
+        rb'\[sub_resource\s+type="([^"]+)"\s+id="([^"]+)"\]'
     )
     NODE_PATTERN = re.compile(
-        r'\[node\s+name="([^"]+)"(?:\s+type="([^"]+)")?(?:\s+parent="([^"]+)")?(?:\s+instance=ExtResource\(\s*"([^"]+)"\s*\))?(?:\s+groups=\[([^\]]+)\])?\]'
+        rb'\[node\s+name="([^"]+)"(?:\s+type="([^"]+)")?(?:\s+parent="([^"]+)")?(?:\s+instance=ExtResource\(\s*"([^"]+)"\s*\))?(?:\s+groups=\[([^\]]+)\])?\]'
     )
     CONNECTION_PATTERN = re.compile(
-        r'\[connection\s+signal="([^"]+)"\s+from="([^"]+)"\s+to="([^"]+)"\s+method="([^"]+)"(?:\s+flags=(\d+))?\]'
-    )
-    PROPERTY_PATTERN = re.compile(
-        r'^(\w+)\s*=\s*(.+)$', re.MULTILINE
+        rb'\[connection\s+signal="([^"]+)"\s+from="([^"]+)"\s+to="([^"]+)"\s+method="([^"]+)"(?:\s+flags=(\d+))?\]'
     )
+    # Property keys may be paths, e.g. "metadata/foo" or "tracks/0/path"
+    PROPERTY_KEY_PATTERN = re.compile(rb'[\w/:]+')
     
-    def parse_file(self, path: str | Path) -> TscnScene:
+    def parse_file(self, path: str | Path, *, parse_properties: bool = True) -> TscnScene:
         """Parse a .tscn file and return structured data."""
-        path = Path(path)
-        content = path.read_text(encoding='utf-8')
-        return self.parse_content(content, str(path))
+        content = Path(path).read_bytes()
+        # Same newline handling as text mode
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        return self.parse_content(content, str(path), parse_properties=parse_properties)
     
-    def parse_content(self, content: str, path: str = "") -> TscnScene:
-        """Parse TSCN content string."""
+    def parse_content(self, content: str | bytes, path: str = "", *,
+                      parse_properties: bool = True) -> TscnScene:
+        """
+        Parse TSCN content, given as text or as UTF-8 bytes. Bytes are
+        parsed as-is and only the extracted fields are decoded.
+        With parse_properties=False only the structure (resources, nodes,
+        connections) is extracted and node and sub resource properties are
+        left empty, which is much cheaper for scenes full of transforms and
+        packed arrays.
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
         scene = TscnScene(path=path)
-        
-        # Parse header
-        header_match = self.HEADER_PATTERN.search(content)
-        if header_match:
-            scene.format_version = int(header_match.group(1))
-        
-        # Parse external resources
-        for match in self.EXT_RESOURCE_PATTERN.finditer(content):
-            resource = TscnResource(
-                id=match.group(4),
-                type=match.group(1),
-                path=match.group(3)
-            )
-            if match.group(2):
-                resource.properties['uid'] = match.group(2)
-            scene.ext_resources.append(resource)
-        
-        # Split into sections
-        sections = re.split(r'\n(?=\[)', content)
-        
-        current_sub_resource = None
         node_map: dict[str, TscnNode] = {}
         
-        for section in sections:
-            section = section.strip()
-            if not section:
+        # Single pass over the lines. Every line starting with "[" opens a
+        # section; the following lines are the properties of the current
+        # node or sub resource, collected until the next section header.
+        current: Optional[TscnNode | TscnResource] = None
+        property_lines: list[bytes] = []
+        header_seen = False
+        
+        for line in content.lstrip().split(b'\n'):
+            if not line.startswith(b'['):
+                if current is not None and parse_properties:
+                    property_lines.append(line)
                 continue
             
-            # Sub resources
-            sub_match = self.SUB_RESOURCE_PATTERN.match(section)
-            if sub_match:
-                resource = TscnResource(
-                    id=sub_match.group(2),
-                    type=sub_match.group(1)
-                )
-                # Parse properties
-                lines = section.split('\n')[1:]
-                resource.properties = self._parse_properties(lines)
-                scene.sub_resources.append(resource)
-                continue
+            # New section: flush the properties of the previous one
+            if current is not None and parse_properties:
+                current.properties = self._parse_properties(property_lines)
+                current = None
+                property_lines = []
             
-            # Nodes
-            node_match = self.NODE_PATTERN.match(section)
-            if node_match:
-                node = TscnNode(
-                    name=node_match.group(1),
-                    type=node_match.group(2),
-                    parent=node_match.group(3),
-                    instance=node_match.group(4)
-                )
-                
-                # Parse groups
-                if node_match.group(5):
-                    groups_str = node_match.group(5)
-                    node.groups = [g.strip().strip('"') for g in groups_str.split(',')]
-                
-                # Parse properties
-                lines = section.split('\n')[1:]
-                node.properties = self._parse_properties(lines)
-                
-                scene.nodes.append(node)
-                
-                # Build parent-child relationships
-                if node.parent is None:
-                    scene.root_node = node
-                    node_map["."] = node
-                else:
-                    parent_path = node.parent
-                    if parent_path in node_map:
-                        node_map[parent_path].children.append(node)
-                    
-                    # Calculate this node's path
-                    if parent_path == ".":
-                        node_path = node.name
-                    else:
-                        node_path = f"{parent_path}/{node.name}"
-                    node_map[node_path] = node
-                
-                continue
+            if line.startswith(b'[node'):
+                node_match = self.NODE_PATTERN.match(line)
+                if node_match:
+                    current = self._add_node(scene, node_map, node_match)
+            
+            elif line.startswith(b'[ext_resource'):
+                ext_match = self.EXT_RESOURCE_PATTERN.match(line)
+                if ext_match:
+                    resource = TscnResource(
+                        id=_decode(ext_match.group(4)),
+                        type=_decode(ext_match.group(1)),
+                        path=_decode(ext_match.group(3))
+                    )
+                    if ext_match.group(2):
+                        resource.properties['uid'] = _decode(ext_match.group(2))
+                    scene.ext_resources.append(resource)
             
-            # Connections
-            conn_match = self.CONNECTION_PATTERN.match(section)
-            if conn_match:
-                connection = TscnConnection(
-                    signal=conn_match.group(1),
-                    from_node=conn_match.group(2),
-                    to_node=conn_match.group(3),
-                    method=conn_match.group(4),
-                    flags=int(conn_match.group(5)) if conn_match.group(5) else 0
-                )
-                scene.connections.append(connection)
+            elif line.startswith(b'[sub_resource'):
+                sub_match = self.SUB_RESOURCE_PATTERN.match(line)
+                if sub_match:
+                    current = TscnResource(
+                        id=_decode(sub_match.group(2)),
+                        type=_decode(sub_match.group(1))
+                    )
+                    scene.sub_resources.append(current)
+            
+            elif line.startswith(b'[connection'):
+                conn_match = self.CONNECTION_PATTERN.match(line)
+                if conn_match:
+                    scene.connections.append(TscnConnection(
+                        signal=_decode(conn_match.group(1)),
+                        from_node=_decode(conn_match.group(2)),
+                        to_node=_decode(conn_match.group(3)),
+                        method=_decode(conn_match.group(4)),
+                        flags=int(conn_match.group(5)) if conn_match.group(5) else 0
+                    ))
+            
+            elif not header_seen and line.startswith(b'[gd_scene'):
+                header_match = self.HEADER_PATTERN.match(line)
+                if header_match:
+                    scene.format_version = int(header_match.group(1))
+                    header_seen = True
+        
+        if current is not None and parse_properties:
+            current.properties = self._parse_properties(property_lines)
         
         return scene
     
-    def _parse_properties(self, lines: list[str]) -> dict:
-        """Parse property lines into a dictionary."""
+    def _add_node(self, scene: TscnScene, node_map: dict[str, TscnNode],
+                  node_match: re.Match) -> TscnNode:
+        """Create a node from its header and link it into the scene tree."""
+        node = TscnNode(
+            name=_decode(node_match.group(1)),
+            type=_decode(node_match.group(2)),
+            parent=_decode(node_match.group(3)),
+            instance=_decode(node_match.group(4))
+        )
+        
+        # Parse groups
+        if node_match.group(5):
+            groups_str = _decode(node_match.group(5))
+            node.groups = frozenset(g.strip().strip('"') for g in groups_str.split(','))
+        
+        scene.nodes.append(node)
+        scene.types.append(node.type)
+        scene.names.append(node.name)
+        scene.parents.append(node.parent)
+        scene.groups.append(node.groups)
+        
+        # Build parent-child relationships
+        if node.parent is None:
+            scene.root_node = node
+            node_map["."] = node
+        else:
+            parent_path = node.parent
+            if parent_path in node_map:
+                node_map[parent_path].children.append(node)
+            
+            # Calculate this node's path
+            if parent_path == ".":
+                node_path = node.name
+            else:
+                node_path = f"{parent_path}/{node.name}"
+            node_map[node_path] = node
+        
+        return node
+    
+    def _parse_properties(self, lines: list[bytes]) -> dict:
+        """Parse raw property lines into a dictionary of decoded strings."""
         properties = {}
         current_key = None
         current_value = []
@@ -187,22 +231,24 @@ class TscnParser:
             if not line:
                 continue
             
-            # Check if this is a new property
-            match = self.PROPERTY_PATTERN.match(line)
-            if match:
+            # Check if this is a new property ("key = value")
+            key, sep, value = line.partition(b'=')
+            key = key.rstrip()
+            value = value.lstrip()
+            if sep and value and self.PROPERTY_KEY_PATTERN.fullmatch(key):
                 # Save previous property if exists
                 if current_key:
-                    properties[current_key] = '\n'.join(current_value)
+                    properties[current_key.decode('utf-8')] = b'\n'.join(current_value).decode('utf-8')
                 
-                current_key = match.group(1)
-                current_value = [match.group(2)]
+                current_key = key
+                current_value = [value]
             elif current_key:
                 # Continuation of previous property
                 current_value.append(line)
         
         # Save last property
         if current_key:
-            properties[current_key] = '\n'.join(current_value)
+            properties[current_key.decode('utf-8')] = b'\n'.join(current_value).decode('utf-8')
         
         return properties
     
@@ -240,7 +286,7 @@ class TscnParser:
                 "name": node.name,
                 "type": node.type,
                 "parent": node.parent,
-                "groups": node.groups,
+                "groups": sorted(node.groups),
                 "properties": node.properties
             }
             if node.instance:
@@ -259,6 +305,6 @@ class TscnParser:
         return {
             "name": node.name,
             "type": node.type or "(instanced)",
-            "groups": node.groups,
+            "groups": sorted(node.groups),
             "children": [self._node_to_tree(c) for c in node.children]
         }
@@ -1,15 +1,32 @@
 """
 Godot MCP Server - Advanced Edition
 Full-featured Godot editor integration + offline project analysis
+
+This module is fully annotated, but it is not meant to be compiled with
+mypyc. It runs as a script and spends its time waiting on the Godot
+bridge. The CPU-heavy parsing lives in analyzers/ (see gdscript_parser.py).
 """
 
 import asyncio
 import json
 import os
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional
 from pathlib import Path
 
 import httpx
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator, see _post/_decode
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional faster event loop (not available on Windows)
+    uvloop = None
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, ImageContent
@@ -21,59 +38,300 @@ from analyzers import ProjectAnalyzer, GDScriptParser, TscnParser, AssetScanner
 GODOT_BRIDGE_URL = "http://127.0.0.1:6550"
 GODOT_RUNTIME_URL = "http://127.0.0.1:6551"
 DEFAULT_TIMEOUT = 30.0
+# Connection pool for the bridge clients: room for concurrent batch calls,
+# idle connections kept for 30s
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+# Concurrent single-item editor calls arriving within this window are sent
+# as one batch request (see _Coalescer)
+COALESCE_WINDOW = 0.005
+# Response bodies above this size are parsed in a worker thread
+LARGE_RESPONSE_BYTES = 512 * 1024
+# Project fingerprints (a walk of the project) are reused for this long, so
+# back-to-back cached scans do not each stat every file
+FINGERPRINT_TTL = 2.0
 
 server = Server("godot-mcp")
 
 # Active project path (set via tool)
-_active_project: Optional[str] = None
+_active_project: Optional[Path] = None  # Resolved once by godot_set_project
 _analyzer: Optional[ProjectAnalyzer] = None
 _asset_scanner: Optional[AssetScanner] = None
+# Offline tools run in worker threads, one call at a time per tool family
+_analyzer_lock = asyncio.Lock()
+_asset_scanner_lock = asyncio.Lock()
+# Last project fingerprint: (analyzer, fingerprint, time.monotonic() taken)
+_fingerprint: Optional[tuple[ProjectAnalyzer, tuple, float]] = None
+
+# Shared HTTP clients per base URL, created on first use and closed by main()
+_http_clients: dict[str, httpx.AsyncClient] = {}
+
+# Read-only editor endpoints fetched with conditional GETs, and their last
+# response: endpoint -> (ETag, body)
+_CONDITIONAL_ENDPOINTS = frozenset({"scene/tree", "scene/tree/flat", "project/scenes", "project/scripts"})
+_etag_cache: dict[str, tuple[str, bytes]] = {}
 
 
 # ============ Godot HTTP Client ============
 
-async def call_godot(endpoint: str, data: dict = None) -> dict:
+def get_http_client(base_url: str) -> httpx.AsyncClient:
+    """
+    Get the pooled client for base_url. Reusing one client keeps its
+    connection pool (and keep-alive connections, where the peer allows
+    them) instead of setting up a new client for every request.
+    The clients stay on HTTP/1.1: the bridges are plain-TCP GDScript
+    servers that handle requests one at a time on the main thread, so
+    concurrent calls already get a connection each and HTTP/2 streams
+    would not be processed any sooner.
+    """
+    client = _http_clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=DEFAULT_TIMEOUT,
+            limits=HTTP_LIMITS
+        )
+        _http_clients[base_url] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def _post(client: httpx.AsyncClient, url: str, data: dict) -> httpx.Response:
+    """POST data as JSON, encoded with orjson when available."""
+    if orjson is None:
+        return await client.post(url, json=data)
+    return await client.post(url, content=orjson.dumps(data), headers={"content-type": "application/json"})
+
+
+async def _decode(content: bytes) -> dict:
+    """
+    Parse a JSON response body. Bridge payloads (scene trees, terrain) can
+    be megabytes; those are parsed in a worker thread so other tool calls
+    keep being served meanwhile.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    if len(content) > LARGE_RESPONSE_BYTES:
+        return await asyncio.to_thread(loads, content)
+    return loads(content)
+
+
+async def call_godot(endpoint: str, data: Optional[dict] = None) -> dict:
     """Make HTTP request to Godot editor plugin."""
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-        try:
-            url = f"{GODOT_BRIDGE_URL}/{endpoint}"
-            if data:
-                response = await client.post(url, json=data)
-            else:
-                response = await client.get(url)
-            return response.json()
-        except httpx.ConnectError:
-            return {
-                "error": "Cannot connect to Godot editor",
-                "hint": "Make sure Godot is running with the Claude Bridge plugin enabled"
-            }
-        except Exception as e:
-            return {"error": str(e)}
+    coalescer = _COALESCERS.get(endpoint)
+    if coalescer is not None and data:
+        return await coalescer.call(data)
+    return await _request_godot(endpoint, data)
+
+
+async def call_godot_text(endpoint: str, data: Optional[dict] = None) -> Any:
+    """
+    Like call_godot, but return the plugin's JSON response as text, for
+    results that are passed on unchanged. Skips parsing and re-encoding
+    the body. Errors are still returned as dicts.
+    """
+    try:
+        return (await _fetch_godot(endpoint, data)).decode('utf-8')
+    except Exception as e:
+        return _godot_error(e)
+
+
+async def _request_godot(endpoint: str, data: Optional[dict] = None) -> dict:
+    """Send one request to the editor plugin."""
+    try:
+        return await _decode(await _fetch_godot(endpoint, data))
+    except Exception as e:
+        return _godot_error(e)
+
+
+async def _fetch_godot(endpoint: str, data: Optional[dict] = None) -> bytes:
+    """Send one request to the editor plugin and return the response body."""
+    client = get_http_client(GODOT_BRIDGE_URL)
+    if data:
+        response = await _post(client, f"/{endpoint}", data)
+    elif endpoint in _CONDITIONAL_ENDPOINTS:
+        return await _conditional_get(client, endpoint)
+    else:
+        response = await client.get(f"/{endpoint}")
+    return response.content
+
+
+def _godot_error(e: Exception) -> dict:
+    if isinstance(e, httpx.ConnectError):
+        return {
+            "error": "Cannot connect to Godot editor",
+            "hint": "Make sure Godot is running with the Claude Bridge plugin enabled"
+        }
+    return {"error": str(e)}
+
+
+async def _conditional_get(client: httpx.AsyncClient, endpoint: str) -> bytes:
+    """
+    GET a read-only endpoint, revalidating the last response with its ETag.
+    When the plugin answers 304 the cached body is returned and is not
+    sent again.
+    """
+    cached = _etag_cache.get(endpoint)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    response = await client.get(f"/{endpoint}", headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache[endpoint] = (etag, response.content)
+    return response.content
+
+
+# Whether the editor plugin splits batch responses per item, which the
+# coalescers rely on; None until a ping has answered
+_batch_results: Optional[bool] = None
+
 
+async def _batch_results_supported() -> bool:
+    """
+    Ask the plugin once whether node/create_many and terrain/heights return
+    per-item results. Plugins before 2.1 do not; their batch calls would
+    apply every item but leave the callers without a result.
+    """
+    global _batch_results
+    if _batch_results is None:
+        response = await _request_godot("ping")
+        if "error" in response:
+            return False  # Not connected; ask again next time
+        _batch_results = "batch_results" in response.get("capabilities", ())
+    return _batch_results
 
-async def call_runtime(endpoint: str, data: dict = None) -> dict:
+
+class _Coalescer:
+    """
+    Groups concurrent calls to a single-item editor endpoint into one call
+    to its batch endpoint, saving a round trip per item. Calls are grouped
+    by key(data); calls for which key returns None are sent on their own.
+    A lone call within the window goes to the single-item endpoint as is,
+    and so does every call if the plugin cannot split batch responses.
+    """
+    
+    def __init__(self, endpoint: str, batch_endpoint: str,
+                 key: Callable[[dict], Any],
+                 to_batch: Callable[[list[dict]], dict],
+                 from_batch: Callable[[dict, int], dict]):
+        self.endpoint = endpoint
+        self.batch_endpoint = batch_endpoint
+        self.key = key
+        self.to_batch = to_batch  # Items -> batch request
+        self.from_batch = from_batch  # (batch response, index) -> single response
+        self._pending: dict[Any, list[tuple[dict, asyncio.Future]]] = {}
+        self._flushing: set[asyncio.Task] = set()
+    
+    async def call(self, data: dict) -> dict:
+        key = self.key(data)
+        if key is None or _batch_results is False:
+            return await _request_godot(self.endpoint, data)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        group = self._pending.get(key)
+        if group is None:
+            group = self._pending[key] = []
+            loop.call_later(COALESCE_WINDOW, self._schedule_flush, key)
+        group.append((data, future))
+        return await future
+    
+    def _schedule_flush(self, key: Any) -> None:
+        task = asyncio.ensure_future(self._flush(self._pending.pop(key)))
+        self._flushing.add(task)  # Keep a reference until it is done
+        task.add_done_callback(self._flushing.discard)
+    
+    async def _flush(self, group: list[tuple[dict, asyncio.Future]]) -> None:
+        if len(group) == 1 or not await _batch_results_supported():
+            results = await asyncio.gather(*(_request_godot(self.endpoint, data) for data, _ in group))
+        else:
+            try:
+                response = await _request_godot(self.batch_endpoint, self.to_batch([data for data, _ in group]))
+                if "error" in response:
+                    results = [response] * len(group)
+                else:
+                    results = [self.from_batch(response, i) for i in range(len(group))]
+            except Exception as e:  # Unexpected batch response
+                results = [{"error": str(e)}] * len(group)
+        
+        for (_, future), result in zip(group, results):
+            if not future.done():  # The caller may have been cancelled
+                future.set_result(result)
+
+
+def _terrain_height_result(response: dict, i: int) -> dict:
+    result = dict(response["results"][i])
+    del result["x"], result["z"]
+    return result
+
+
+def _instance_batch(items: list[dict]) -> dict:
+    instances = []
+    for data in items:
+        instance = {key: data[key] for key in ("position", "rotation", "scale") if key in data}
+        if "node_name" in data:
+            instance["name"] = data["node_name"]
+        instances.append(instance)
+    return {
+        "scene_path": items[0]["scene_path"],
+        "parent_path": items[0].get("parent_path", "."),
+        "instances": instances
+    }
+
+
+# Single-item endpoint -> coalescer over its batch endpoint
+_COALESCERS: dict[str, _Coalescer] = {
+    "terrain/height": _Coalescer(
+        "terrain/height", "terrain/heights",
+        key=lambda data: () if "x" in data and "z" in data else None,
+        to_batch=lambda items: {"positions": [[data["x"], data["z"]] for data in items]},
+        from_batch=_terrain_height_result
+    ),
+    "node/create": _Coalescer(
+        "node/create", "node/create_many",
+        key=lambda data: () if "node_type" in data and "node_name" in data else None,
+        to_batch=lambda items: {"nodes": items},
+        from_batch=lambda response, i: response["results"][i]
+    ),
+    # Batched per scene and parent, which instantiate_many shares
+    "scene/instantiate": _Coalescer(
+        "scene/instantiate", "scene/instantiate_many",
+        key=lambda data: (data["scene_path"], data.get("parent_path", ".")) if "scene_path" in data else None,
+        to_batch=_instance_batch,
+        from_batch=lambda response, i: {"success": True, "path": response["created"][i]}
+    ),
+}
+
+
+async def call_runtime(endpoint: str, data: Optional[dict] = None) -> dict:
     """Make HTTP request to running Godot game."""
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-        try:
-            url = f"{GODOT_RUNTIME_URL}/{endpoint}"
-            if data:
-                response = await client.post(url, json=data)
-            else:
-                response = await client.get(url)
-            return response.json()
-        except httpx.ConnectError:
-            return {
-                "error": "Cannot connect to running game",
-                "hint": "Make sure the game is running with ClaudeRuntimeDebug autoload enabled"
-            }
-        except Exception as e:
-            return {"error": str(e)}
+    client = get_http_client(GODOT_RUNTIME_URL)
+    try:
+        if data:
+            response = await _post(client, f"/{endpoint}", data)
+        else:
+            response = await client.get(f"/{endpoint}")
+        return await _decode(response.content)
+    except httpx.ConnectError:
+        return {
+            "error": "Cannot connect to running game",
+            "hint": "Make sure the game is running with ClaudeRuntimeDebug autoload enabled"
+        }
+    except Exception as e:
+        return {"error": str(e)}
 
 
 def get_analyzer() -> Optional[ProjectAnalyzer]:
     """Get the project analyzer for offline analysis."""
     global _analyzer, _active_project
-    if _active_project and (not _analyzer or _analyzer.project_path != Path(_active_project)):
+    if _active_project and (_analyzer is None or _analyzer.project_path != _active_project):
         _analyzer = ProjectAnalyzer(_active_project)
     return _analyzer
 
@@ -81,904 +339,998 @@ def get_analyzer() -> Optional[ProjectAnalyzer]:
 def get_asset_scanner() -> Optional[AssetScanner]:
     """Get the asset scanner for asset indexing."""
     global _asset_scanner, _active_project
-    if _active_project and (not _asset_scanner or _asset_scanner.project_path != Path(_active_project)):
+    if _active_project and (_asset_scanner is None or _asset_scanner.project_path != _active_project):
         _asset_scanner = AssetScanner(_active_project)
     return _asset_scanner
 
 
 # ============ Tool Definitions ============
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        # === Connection & Project ===
-        Tool(
-            name="godot_ping",
-            description="Check if Godot editor is connected and responding",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_set_project",
-            description="Set the active Godot project path for offline analysis. Required before using analysis tools.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_path": {
-                        "type": "string",
-                        "description": "Absolute path to the Godot project folder (containing project.godot)"
-                    }
-                },
-                "required": ["project_path"]
-            }
-        ),
-        
-        # === Scene Tree (Live) ===
-        Tool(
-            name="godot_get_scene_tree",
-            description="Get the current scene's full node hierarchy from the running editor",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_get_flat_nodes",
-            description="Get a flat list of all nodes in the current scene with positions",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_open_scene",
-            description="Open a scene file in the editor",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {"type": "string", "description": "Resource path (e.g., 'res://scenes/main.tscn')"}
-                },
-                "required": ["scene_path"]
-            }
-        ),
-        Tool(
-            name="godot_save_scene",
-            description="Save the currently open scene",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        
-        # === Selection ===
-        Tool(
-            name="godot_get_selected",
-            description="Get currently selected nodes in the editor",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_select_nodes",
-            description="Select nodes by their paths",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_paths": {"type": "array", "items": {"type": "string"}}
-                },
-                "required": ["node_paths"]
-            }
-        ),
-        Tool(
-            name="godot_select_by_type",
-            description="Select all nodes of a specific type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "description": "Node type (e.g., 'MeshInstance3D', 'Area3D')"}
-                },
-                "required": ["type"]
-            }
-        ),
-        Tool(
-            name="godot_select_by_group",
-            description="Select all nodes in a specific group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group": {"type": "string"}
-                },
-                "required": ["group"]
-            }
-        ),
-        
-        # === Node Creation ===
-        Tool(
-            name="godot_create_node",
-            description="Create a new node in the scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_type": {"type": "string", "description": "Node class (e.g., 'Node3D', 'MeshInstance3D')"},
-                    "node_name": {"type": "string"},
-                    "parent_path": {"type": "string", "description": "Path to parent node, or '.' for root"},
-                    "position": {"type": "array", "items": {"type": "number"}, "description": "[x, y, z]"},
-                    "rotation": {"type": "array", "items": {"type": "number"}, "description": "[x, y, z] in degrees"},
-                    "scale": {"type": "array", "items": {"type": "number"}, "description": "[x, y, z]"}
-                },
-                "required": ["node_type", "node_name"]
-            }
-        ),
-        Tool(
-            name="godot_create_many_nodes",
-            description="Create multiple nodes at once",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "nodes": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "node_type": {"type": "string"},
-                                "node_name": {"type": "string"},
-                                "parent_path": {"type": "string"},
-                                "position": {"type": "array"},
-                                "rotation": {"type": "array"},
-                                "scale": {"type": "array"}
-                            }
+# Schema leaves shared by reference between tools. They are only ever
+# serialized, never mutated.
+_EMPTY_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+_STR: dict[str, Any] = {"type": "string"}
+_NUM: dict[str, Any] = {"type": "number"}
+_INT: dict[str, Any] = {"type": "integer"}
+_BOOL: dict[str, Any] = {"type": "boolean"}
+_ARRAY: dict[str, Any] = {"type": "array"}
+_STR_ARRAY: dict[str, Any] = {"type": "array", "items": _STR}
+_NUM_ARRAY: dict[str, Any] = {"type": "array", "items": _NUM}
+
+# Static, so built once at import instead of on every list_tools call
+_TOOLS: list[Tool] = [
+    # === Connection & Project ===
+    Tool(
+        name="godot_ping",
+        description="Check if Godot editor is connected and responding",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_set_project",
+        description="Set the active Godot project path for offline analysis. Required before using analysis tools.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_path": {
+                    "type": "string",
+                    "description": "Absolute path to the Godot project folder (containing project.godot)"
+                }
+            },
+            "required": ["project_path"]
+        }
+    ),
+    
+    # === Scene Tree (Live) ===
+    Tool(
+        name="godot_get_scene_tree",
+        description="Get the current scene's full node hierarchy from the running editor",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_get_flat_nodes",
+        description="Get a flat list of all nodes in the current scene with positions",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_open_scene",
+        description="Open a scene file in the editor",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": {"type": "string", "description": "Resource path (e.g., 'res://scenes/main.tscn')"}
+            },
+            "required": ["scene_path"]
+        }
+    ),
+    Tool(
+        name="godot_save_scene",
+        description="Save the currently open scene",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    
+    # === Selection ===
+    Tool(
+        name="godot_get_selected",
+        description="Get currently selected nodes in the editor",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_select_nodes",
+        description="Select nodes by their paths",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_paths": _STR_ARRAY
+            },
+            "required": ["node_paths"]
+        }
+    ),
+    Tool(
+        name="godot_select_by_type",
+        description="Select all nodes of a specific type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "description": "Node type (e.g., 'MeshInstance3D', 'Area3D')"}
+            },
+            "required": ["type"]
+        }
+    ),
+    Tool(
+        name="godot_select_by_group",
+        description="Select all nodes in a specific group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group": _STR
+            },
+            "required": ["group"]
+        }
+    ),
+    
+    # === Node Creation ===
+    Tool(
+        name="godot_create_node",
+        description="Create a new node in the scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_type": {"type": "string", "description": "Node class (e.g., 'Node3D', 'MeshInstance3D')"},
+                "node_name": _STR,
+                "parent_path": {"type": "string", "description": "Path to parent node, or '.' for root"},
+                "position": {"type": "array", "items": _NUM, "description": "[x, y, z]"},
+                "rotation": {"type": "array", "items": _NUM, "description": "[x, y, z] in degrees"},
+                "scale": {"type": "array", "items": _NUM, "description": "[x, y, z]"}
+            },
+            "required": ["node_type", "node_name"]
+        }
+    ),
+    Tool(
+        name="godot_create_many_nodes",
+        description="Create multiple nodes at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "nodes": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "node_type": _STR,
+                            "node_name": _STR,
+                            "parent_path": _STR,
+                            "position": _ARRAY,
+                            "rotation": _ARRAY,
+                            "scale": _ARRAY
                         }
                     }
-                },
-                "required": ["nodes"]
-            }
-        ),
-        Tool(
-            name="godot_delete_node",
-            description="Delete a node from the scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_path": {"type": "string"}
-                },
-                "required": ["node_path"]
-            }
-        ),
-        Tool(
-            name="godot_duplicate_node",
-            description="Duplicate a node",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_path": {"type": "string"},
-                    "new_name": {"type": "string"},
-                    "offset": {"type": "array", "items": {"type": "number"}, "description": "[x, y, z] offset"}
-                },
-                "required": ["node_path"]
-            }
-        ),
-        
-        # === Node Properties ===
-        Tool(
-            name="godot_get_properties",
-            description="Get all properties of a node",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_path": {"type": "string"},
-                    "filter": {"type": "array", "items": {"type": "string"}, "description": "Only return these properties"}
-                },
-                "required": ["node_path"]
-            }
-        ),
-        Tool(
-            name="godot_set_property",
-            description="Set a property on a node",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_path": {"type": "string"},
-                    "property": {"type": "string"},
-                    "value": {"description": "Value to set (arrays become Vector3/Color)"}
-                },
-                "required": ["node_path", "property", "value"]
-            }
-        ),
-        Tool(
-            name="godot_set_multiple_properties",
-            description="Set multiple properties on a node at once",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_path": {"type": "string"},
-                    "properties": {"type": "object", "description": "Dict of property_name: value"}
-                },
-                "required": ["node_path", "properties"]
-            }
-        ),
-        
-        # === Groups ===
-        Tool(
-            name="godot_add_to_group",
-            description="Add a node to a group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_path": {"type": "string"},
-                    "group": {"type": "string"}
-                },
-                "required": ["node_path", "group"]
-            }
-        ),
-        Tool(
-            name="godot_remove_from_group",
-            description="Remove a node from a group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_path": {"type": "string"},
-                    "group": {"type": "string"}
-                },
-                "required": ["node_path", "group"]
-            }
-        ),
-        
-        # === Scene Instantiation ===
-        Tool(
-            name="godot_instantiate_scene",
-            description="Instantiate a packed scene into the current scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {"type": "string", "description": "Resource path to .tscn"},
-                    "parent_path": {"type": "string"},
-                    "node_name": {"type": "string"},
-                    "position": {"type": "array", "items": {"type": "number"}},
-                    "rotation": {"type": "array", "items": {"type": "number"}},
-                    "scale": {"type": "array", "items": {"type": "number"}}
-                },
-                "required": ["scene_path"]
-            }
-        ),
-        Tool(
-            name="godot_instantiate_many",
-            description="Instantiate multiple copies of a scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {"type": "string"},
-                    "parent_path": {"type": "string"},
-                    "instances": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "position": {"type": "array"},
-                                "rotation": {"type": "array"},
-                                "scale": {"type": "array"}
-                            }
+                }
+            },
+            "required": ["nodes"]
+        }
+    ),
+    Tool(
+        name="godot_delete_node",
+        description="Delete a node from the scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_path": _STR
+            },
+            "required": ["node_path"]
+        }
+    ),
+    Tool(
+        name="godot_duplicate_node",
+        description="Duplicate a node",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_path": _STR,
+                "new_name": _STR,
+                "offset": {"type": "array", "items": _NUM, "description": "[x, y, z] offset"}
+            },
+            "required": ["node_path"]
+        }
+    ),
+    
+    # === Node Properties ===
+    Tool(
+        name="godot_get_properties",
+        description="Get all properties of a node",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_path": _STR,
+                "filter": {"type": "array", "items": _STR, "description": "Only return these properties"}
+            },
+            "required": ["node_path"]
+        }
+    ),
+    Tool(
+        name="godot_set_property",
+        description="Set a property on a node",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_path": _STR,
+                "property": _STR,
+                "value": {"description": "Value to set (arrays become Vector3/Color)"}
+            },
+            "required": ["node_path", "property", "value"]
+        }
+    ),
+    Tool(
+        name="godot_set_multiple_properties",
+        description="Set multiple properties on a node at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_path": _STR,
+                "properties": {"type": "object", "description": "Dict of property_name: value"}
+            },
+            "required": ["node_path", "properties"]
+        }
+    ),
+    
+    # === Groups ===
+    Tool(
+        name="godot_add_to_group",
+        description="Add a node to a group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_path": _STR,
+                "group": _STR
+            },
+            "required": ["node_path", "group"]
+        }
+    ),
+    Tool(
+        name="godot_remove_from_group",
+        description="Remove a node from a group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_path": _STR,
+                "group": _STR
+            },
+            "required": ["node_path", "group"]
+        }
+    ),
+    
+    # === Scene Instantiation ===
+    Tool(
+        name="godot_instantiate_scene",
+        description="Instantiate a packed scene into the current scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": {"type": "string", "description": "Resource path to .tscn"},
+                "parent_path": _STR,
+                "node_name": _STR,
+                "position": _NUM_ARRAY,
+                "rotation": _NUM_ARRAY,
+                "scale": _NUM_ARRAY
+            },
+            "required": ["scene_path"]
+        }
+    ),
+    Tool(
+        name="godot_instantiate_many",
+        description="Instantiate multiple copies of a scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": _STR,
+                "parent_path": _STR,
+                "instances": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": _STR,
+                            "position": _ARRAY,
+                            "rotation": _ARRAY,
+                            "scale": _ARRAY
                         }
                     }
-                },
-                "required": ["scene_path", "instances"]
-            }
-        ),
-        
-        # === Terrain & Level Design ===
-        Tool(
-            name="godot_get_terrain_height",
-            description="Get terrain height at a position via raycast",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "number"},
-                    "z": {"type": "number"}
-                },
-                "required": ["x", "z"]
-            }
-        ),
-        Tool(
-            name="godot_get_terrain_heights",
-            description="Get terrain heights at multiple positions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "positions": {
-                        "type": "array",
-                        "items": {"type": "array", "items": {"type": "number"}},
-                        "description": "Array of [x, z] positions"
-                    }
-                },
-                "required": ["positions"]
-            }
-        ),
-        Tool(
-            name="godot_scatter_objects",
-            description="Scatter objects randomly in an area with terrain alignment and slope filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {"type": "string", "description": "Scene to scatter"},
-                    "count": {"type": "integer", "description": "Number to place"},
-                    "center": {"type": "array", "description": "[x, y, z] center point"},
-                    "radius": {"type": "number", "description": "Scatter radius"},
-                    "min_distance": {"type": "number", "description": "Minimum distance between objects"},
-                    "max_slope": {"type": "number", "description": "Maximum terrain slope in degrees"},
-                    "align_to_terrain": {"type": "boolean", "description": "Align to surface normal"},
-                    "random_rotation_y": {"type": "boolean", "description": "Random Y rotation"},
-                    "scale_range": {"type": "array", "description": "[min, max] scale range"},
-                    "parent_path": {"type": "string"}
-                },
-                "required": ["scene_path", "count"]
-            }
-        ),
-        Tool(
-            name="godot_place_along_path",
-            description="Place objects along a path/spline with optional terrain snapping",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {"type": "string"},
-                    "points": {"type": "array", "description": "Array of [x, y, z] waypoints"},
-                    "spacing": {"type": "number", "description": "Distance between placements"},
-                    "align_to_path": {"type": "boolean", "description": "Rotate to face path direction"},
-                    "snap_to_terrain": {"type": "boolean"},
-                    "parent_path": {"type": "string"}
-                },
-                "required": ["scene_path", "points"]
-            }
-        ),
-        Tool(
-            name="godot_place_grid",
-            description="Place objects in a grid pattern",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {"type": "string"},
-                    "origin": {"type": "array", "description": "[x, y, z]"},
-                    "size_x": {"type": "integer"},
-                    "size_z": {"type": "integer"},
-                    "spacing": {"type": "number"},
-                    "snap_to_terrain": {"type": "boolean"},
-                    "parent_path": {"type": "string"}
-                },
-                "required": ["scene_path"]
-            }
-        ),
-        
-        # === Batch Operations ===
-        Tool(
-            name="godot_batch_set_property",
-            description="Set a property on multiple nodes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_paths": {"type": "array", "items": {"type": "string"}},
-                    "property": {"type": "string"},
-                    "value": {}
-                },
-                "required": ["node_paths", "property", "value"]
-            }
-        ),
-        Tool(
-            name="godot_batch_add_to_group",
-            description="Add multiple nodes to a group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_paths": {"type": "array", "items": {"type": "string"}},
-                    "group": {"type": "string"}
-                },
-                "required": ["node_paths", "group"]
-            }
-        ),
-        Tool(
-            name="godot_batch_delete_by_type",
-            description="Delete all nodes of a specific type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string"}
-                },
-                "required": ["type"]
-            }
-        ),
-        Tool(
-            name="godot_batch_delete_by_group",
-            description="Delete all nodes in a group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group": {"type": "string"}
-                },
-                "required": ["group"]
-            }
-        ),
-        Tool(
-            name="godot_batch_replace_mesh",
-            description="Replace a mesh resource across all MeshInstance3D nodes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "old_mesh_path": {"type": "string"},
-                    "new_mesh_path": {"type": "string"}
-                },
-                "required": ["old_mesh_path", "new_mesh_path"]
-            }
-        ),
-        
-        # === Search ===
-        Tool(
-            name="godot_search_nodes",
-            description="Search nodes by multiple criteria",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "description": "Node type to match"},
-                    "name_contains": {"type": "string", "description": "Name substring"},
-                    "group": {"type": "string", "description": "Group membership"},
-                    "has_property": {"type": "string", "description": "Property that must exist"}
                 }
-            }
-        ),
-        Tool(
-            name="godot_find_by_type",
-            description="Find all nodes of a type",
-            inputSchema={
-                "type": "object",
-                "properties": {"type": {"type": "string"}},
-                "required": ["type"]
-            }
-        ),
-        Tool(
-            name="godot_find_by_group",
-            description="Find all nodes in a group",
-            inputSchema={
-                "type": "object",
-                "properties": {"group": {"type": "string"}},
-                "required": ["group"]
-            }
-        ),
-        Tool(
-            name="godot_find_by_name",
-            description="Find nodes by name pattern",
-            inputSchema={
-                "type": "object",
-                "properties": {"pattern": {"type": "string"}},
-                "required": ["pattern"]
-            }
-        ),
-        
-        # === Project (Live) ===
-        Tool(
-            name="godot_list_scenes",
-            description="List all .tscn scene files in the project (via editor)",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_list_scripts",
-            description="List all .gd script files in the project (via editor)",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        
-        # === Debug ===
-        Tool(
-            name="godot_run_scene",
-            description="Run the current scene in the editor",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_stop_running",
-            description="Stop the running game",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_get_debug_logs",
-            description="Get debug logs from the editor including script execution output and errors",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "count": {"type": "integer", "description": "Max number of log entries to return (default 100)"},
-                    "level": {"type": "string", "description": "Filter by level: info, warning, error, output"}
-                }
-            }
-        ),
-        Tool(
-            name="godot_clear_debug_logs",
-            description="Clear the debug log buffer",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        
-        # === Vision ===
-        Tool(
-            name="godot_get_viewport_screenshot",
-            description="Capture a screenshot of the editor viewport. Returns base64 encoded PNG image that Claude can see and analyze.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "viewport": {"type": "string", "description": "Which viewport: '3d' or '2d' (default: '3d')"},
-                    "width": {"type": "integer", "description": "Resize to width (0 = original size)"},
-                    "height": {"type": "integer", "description": "Resize to height (0 = original size)"}
-                }
-            }
-        ),
-        
-        # === Runtime (Running Game) ===
-        Tool(
-            name="godot_game_ping",
-            description="Check if the running game is responding. Use this before taking game screenshots.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_game_screenshot",
-            description="Capture a screenshot of the RUNNING GAME (not the editor). Game must be running with ClaudeRuntimeDebug autoload. Returns base64 PNG image.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "width": {"type": "integer", "description": "Resize to width (0 = original size)"},
-                    "height": {"type": "integer", "description": "Resize to height (0 = original size)"}
-                }
-            }
-        ),
-        Tool(
-            name="godot_game_info",
-            description="Get info about the running game: current scene, FPS, viewport size.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="godot_wait",
-            description="Wait for a specified number of seconds. Useful after godot_run_scene to let the game boot before taking a screenshot.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "seconds": {"type": "number", "description": "Seconds to wait (default: 2.0)"}
+            },
+            "required": ["scene_path", "instances"]
+        }
+    ),
+    
+    # === Terrain & Level Design ===
+    Tool(
+        name="godot_get_terrain_height",
+        description="Get terrain height at a position via raycast",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": _NUM,
+                "z": _NUM
+            },
+            "required": ["x", "z"]
+        }
+    ),
+    Tool(
+        name="godot_get_terrain_heights",
+        description="Get terrain heights at multiple positions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "positions": {
+                    "type": "array",
+                    "items": _NUM_ARRAY,
+                    "description": "Array of [x, z] positions"
                 }
+            },
+            "required": ["positions"]
+        }
+    ),
+    Tool(
+        name="godot_scatter_objects",
+        description="Scatter objects randomly in an area with terrain alignment and slope filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": {"type": "string", "description": "Scene to scatter"},
+                "count": {"type": "integer", "description": "Number to place"},
+                "center": {"type": "array", "description": "[x, y, z] center point"},
+                "radius": {"type": "number", "description": "Scatter radius"},
+                "min_distance": {"type": "number", "description": "Minimum distance between objects"},
+                "max_slope": {"type": "number", "description": "Maximum terrain slope in degrees"},
+                "align_to_terrain": {"type": "boolean", "description": "Align to surface normal"},
+                "random_rotation_y": {"type": "boolean", "description": "Random Y rotation"},
+                "scale_range": {"type": "array", "description": "[min, max] scale range"},
+                "parent_path": _STR
+            },
+            "required": ["scene_path", "count"]
+        }
+    ),
+    Tool(
+        name="godot_place_along_path",
+        description="Place objects along a path/spline with optional terrain snapping",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": _STR,
+                "points": {"type": "array", "description": "Array of [x, y, z] waypoints"},
+                "spacing": {"type": "number", "description": "Distance between placements"},
+                "align_to_path": {"type": "boolean", "description": "Rotate to face path direction"},
+                "snap_to_terrain": _BOOL,
+                "parent_path": _STR
+            },
+            "required": ["scene_path", "points"]
+        }
+    ),
+    Tool(
+        name="godot_place_grid",
+        description="Place objects in a grid pattern",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": _STR,
+                "origin": {"type": "array", "description": "[x, y, z]"},
+                "size_x": _INT,
+                "size_z": _INT,
+                "spacing": _NUM,
+                "snap_to_terrain": _BOOL,
+                "parent_path": _STR
+            },
+            "required": ["scene_path"]
+        }
+    ),
+    
+    # === Batch Operations ===
+    Tool(
+        name="godot_batch_set_property",
+        description="Set a property on multiple nodes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_paths": _STR_ARRAY,
+                "property": _STR,
+                "value": {}
+            },
+            "required": ["node_paths", "property", "value"]
+        }
+    ),
+    Tool(
+        name="godot_batch_add_to_group",
+        description="Add multiple nodes to a group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_paths": _STR_ARRAY,
+                "group": _STR
+            },
+            "required": ["node_paths", "group"]
+        }
+    ),
+    Tool(
+        name="godot_batch_delete_by_type",
+        description="Delete all nodes of a specific type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": _STR
+            },
+            "required": ["type"]
+        }
+    ),
+    Tool(
+        name="godot_batch_delete_by_group",
+        description="Delete all nodes in a group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group": _STR
+            },
+            "required": ["group"]
+        }
+    ),
+    Tool(
+        name="godot_batch_replace_mesh",
+        description="Replace a mesh resource across all MeshInstance3D nodes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "old_mesh_path": _STR,
+                "new_mesh_path": _STR
+            },
+            "required": ["old_mesh_path", "new_mesh_path"]
+        }
+    ),
+    
+    # === Search ===
+    Tool(
+        name="godot_search_nodes",
+        description="Search nodes by multiple criteria",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "description": "Node type to match"},
+                "name_contains": {"type": "string", "description": "Name substring"},
+                "group": {"type": "string", "description": "Group membership"},
+                "has_property": {"type": "string", "description": "Property that must exist"}
             }
-        ),
-        
-        # === Script Execution ===
-        Tool(
-            name="godot_execute",
-            description="Execute arbitrary GDScript code in the editor. Has access to 'editor', 'scene_root', 'selection'.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "code": {"type": "string", "description": "GDScript code to execute"}
-                },
-                "required": ["code"]
-            }
-        ),
-        Tool(
-            name="godot_execute_on_selected",
-            description="Execute code on each selected node. Has access to 'node' (current node) and 'editor'.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "code": {"type": "string"}
-                },
-                "required": ["code"]
-            }
-        ),
-        
-        # ========== OFFLINE ANALYSIS (No Godot Required) ==========
-        
-        Tool(
-            name="analyze_project_info",
-            description="Get project.godot info including autoloads and input actions (offline)",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="analyze_scan_scripts",
-            description="Scan all GDScript files in the project (offline)",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="analyze_scan_scenes",
-            description="Scan all scene files in the project (offline)",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="analyze_script",
-            description="Get detailed analysis of a single script file (offline)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_path": {"type": "string", "description": "Relative path from project root"}
-                },
-                "required": ["script_path"]
-            }
-        ),
-        Tool(
-            name="analyze_scene",
-            description="Get detailed analysis of a single scene file (offline)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {"type": "string", "description": "Relative path from project root"}
-                },
-                "required": ["scene_path"]
-            }
-        ),
-        Tool(
-            name="analyze_find_nodes_by_type",
-            description="Find all nodes of a type across all scenes (offline)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_type": {"type": "string"}
-                },
-                "required": ["node_type"]
-            }
-        ),
-        Tool(
-            name="analyze_find_nodes_by_group",
-            description="Find all nodes in a group across all scenes (offline)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group_name": {"type": "string"}
-                },
-                "required": ["group_name"]
-            }
-        ),
-        Tool(
-            name="analyze_find_script_usages",
-            description="Search for function/variable/signal names across all scripts (offline)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "search_term": {"type": "string"}
-                },
-                "required": ["search_term"]
+        }
+    ),
+    Tool(
+        name="godot_find_by_type",
+        description="Find all nodes of a type",
+        inputSchema={
+            "type": "object",
+            "properties": {"type": _STR},
+            "required": ["type"]
+        }
+    ),
+    Tool(
+        name="godot_find_by_group",
+        description="Find all nodes in a group",
+        inputSchema={
+            "type": "object",
+            "properties": {"group": _STR},
+            "required": ["group"]
+        }
+    ),
+    Tool(
+        name="godot_find_by_name",
+        description="Find nodes by name pattern",
+        inputSchema={
+            "type": "object",
+            "properties": {"pattern": _STR},
+            "required": ["pattern"]
+        }
+    ),
+    
+    # === Project (Live) ===
+    Tool(
+        name="godot_list_scenes",
+        description="List all .tscn scene files in the project (via editor)",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_list_scripts",
+        description="List all .gd script files in the project (via editor)",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    
+    # === Debug ===
+    Tool(
+        name="godot_run_scene",
+        description="Run the current scene in the editor",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_stop_running",
+        description="Stop the running game",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_get_debug_logs",
+        description="Get debug logs from the editor including script execution output and errors",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer", "description": "Max number of log entries to return (default 100)"},
+                "level": {"type": "string", "description": "Filter by level: info, warning, error, output"}
             }
-        ),
-        Tool(
-            name="analyze_find_signal_connections",
-            description="Find all connections for a signal across scenes (offline)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "signal_name": {"type": "string"}
-                },
-                "required": ["signal_name"]
+        }
+    ),
+    Tool(
+        name="godot_clear_debug_logs",
+        description="Clear the debug log buffer",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    
+    # === Vision ===
+    Tool(
+        name="godot_get_viewport_screenshot",
+        description="Capture a screenshot of the editor viewport. Returns base64 encoded PNG image that Claude can see and analyze.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "viewport": {"type": "string", "description": "Which viewport: '3d' or '2d' (default: '3d')"},
+                "width": {"type": "integer", "description": "Resize to width (0 = original size)"},
+                "height": {"type": "integer", "description": "Resize to height (0 = original size)"}
             }
-        ),
-        Tool(
-            name="analyze_dependency_graph",
-            description="Get dependency graph of scripts and scenes (offline)",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="analyze_find_orphans",
-            description="Find resources that aren't referenced anywhere (offline)",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="analyze_search_in_files",
-            description="Search for a regex pattern across project files (offline)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pattern": {"type": "string", "description": "Regex pattern to search"},
-                    "file_types": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "File extensions to search (default: .gd, .tscn, .tres)"
-                    }
-                },
-                "required": ["pattern"]
+        }
+    ),
+    
+    # === Runtime (Running Game) ===
+    Tool(
+        name="godot_game_ping",
+        description="Check if the running game is responding. Use this before taking game screenshots.",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_game_screenshot",
+        description="Capture a screenshot of the RUNNING GAME (not the editor). Game must be running with ClaudeRuntimeDebug autoload. Returns base64 PNG image.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "width": {"type": "integer", "description": "Resize to width (0 = original size)"},
+                "height": {"type": "integer", "description": "Resize to height (0 = original size)"}
             }
-        ),
-        
-        # ========== ASSET SCANNING ==========
-        
-        Tool(
-            name="assets_scan",
-            description="Scan and index all assets in the project. Detects asset packs (TriForge, Synty, etc), categories (trees, ruins, etc), and generates tags. Results are cached.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "force": {"type": "boolean", "description": "Force rescan even if cache exists"},
-                    "exclude_addons": {"type": "boolean", "description": "Skip the addons folder"}
-                }
+        }
+    ),
+    Tool(
+        name="godot_game_info",
+        description="Get info about the running game: current scene, FPS, viewport size.",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="godot_wait",
+        description="Wait for a specified number of seconds. Useful after godot_run_scene to let the game boot before taking a screenshot.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "seconds": {"type": "number", "description": "Seconds to wait (default: 2.0)"}
             }
-        ),
-        Tool(
-            name="assets_search",
-            description="Search assets by query, type, pack, category, or tags",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search in path and tags"},
-                    "type": {"type": "string", "description": "Asset type: mesh, texture, scene, script, audio, etc"},
-                    "pack": {"type": "string", "description": "Asset pack: triforge, synty, quaternius, etc"},
-                    "category": {"type": "string", "description": "Category: trees, rocks, ruins, buildings, props, creatures, etc"},
-                    "tags": {"type": "array", "items": {"type": "string"}, "description": "All tags must match"},
-                    "limit": {"type": "integer", "description": "Max results (default 50)"}
+        }
+    ),
+    
+    # === Script Execution ===
+    Tool(
+        name="godot_execute",
+        description="Execute arbitrary GDScript code in the editor. Has access to 'editor', 'scene_root', 'selection'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "code": {"type": "string", "description": "GDScript code to execute"}
+            },
+            "required": ["code"]
+        }
+    ),
+    Tool(
+        name="godot_execute_on_selected",
+        description="Execute code on each selected node. Has access to 'node' (current node) and 'editor'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "code": _STR
+            },
+            "required": ["code"]
+        }
+    ),
+    
+    # ========== OFFLINE ANALYSIS (No Godot Required) ==========
+    
+    Tool(
+        name="analyze_project_info",
+        description="Get project.godot info including autoloads and input actions (offline)",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="analyze_scan_scripts",
+        description="Scan all GDScript files in the project (offline)",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="analyze_scan_scenes",
+        description="Scan all scene files in the project (offline)",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="analyze_script",
+        description="Get detailed analysis of a single script file (offline)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "script_path": {"type": "string", "description": "Relative path from project root"}
+            },
+            "required": ["script_path"]
+        }
+    ),
+    Tool(
+        name="analyze_scene",
+        description="Get detailed analysis of a single scene file (offline)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": {"type": "string", "description": "Relative path from project root"}
+            },
+            "required": ["scene_path"]
+        }
+    ),
+    Tool(
+        name="analyze_find_nodes_by_type",
+        description="Find all nodes of a type across all scenes (offline)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_type": _STR
+            },
+            "required": ["node_type"]
+        }
+    ),
+    Tool(
+        name="analyze_find_nodes_by_group",
+        description="Find all nodes in a group across all scenes (offline)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_name": _STR
+            },
+            "required": ["group_name"]
+        }
+    ),
+    Tool(
+        name="analyze_find_script_usages",
+        description="Search for function/variable/signal names across all scripts (offline)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "search_term": _STR
+            },
+            "required": ["search_term"]
+        }
+    ),
+    Tool(
+        name="analyze_find_signal_connections",
+        description="Find all connections for a signal across scenes (offline)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "signal_name": _STR
+            },
+            "required": ["signal_name"]
+        }
+    ),
+    Tool(
+        name="analyze_dependency_graph",
+        description="Get dependency graph of scripts and scenes (offline)",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="analyze_find_orphans",
+        description="Find resources that aren't referenced anywhere (offline)",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="analyze_search_in_files",
+        description="Search for a regex pattern across project files (offline)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern": {"type": "string", "description": "Regex pattern to search"},
+                "file_types": {
+                    "type": "array",
+                    "items": _STR,
+                    "description": "File extensions to search (default: .gd, .tscn, .tres)"
                 }
+            },
+            "required": ["pattern"]
+        }
+    ),
+    
+    # ========== ASSET SCANNING ==========
+    
+    Tool(
+        name="assets_scan",
+        description="Scan and index all assets in the project. Detects asset packs (TriForge, Synty, etc), categories (trees, ruins, etc), and generates tags. Results are cached.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "force": {"type": "boolean", "description": "Force rescan even if cache exists"},
+                "exclude_addons": {"type": "boolean", "description": "Skip the addons folder"}
             }
-        ),
-        Tool(
-            name="assets_random",
-            description="Get random assets matching filters - great for scattering varied objects",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {"type": "string", "description": "Asset type filter"},
-                    "pack": {"type": "string", "description": "Asset pack filter"},
-                    "category": {"type": "string", "description": "Category filter"},
-                    "count": {"type": "integer", "description": "Number of random assets (default 1)"}
-                }
+        }
+    ),
+    Tool(
+        name="assets_search",
+        description="Search assets by query, type, pack, category, or tags",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search in path and tags"},
+                "type": {"type": "string", "description": "Asset type: mesh, texture, scene, script, audio, etc"},
+                "pack": {"type": "string", "description": "Asset pack: triforge, synty, quaternius, etc"},
+                "category": {"type": "string", "description": "Category: trees, rocks, ruins, buildings, props, creatures, etc"},
+                "tags": {"type": "array", "items": _STR, "description": "All tags must match"},
+                "limit": {"type": "integer", "description": "Max results (default 50)"}
             }
-        ),
-        Tool(
-            name="assets_list_packs",
-            description="List all detected asset packs with counts",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="assets_list_categories",
-            description="List all asset categories with counts",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="assets_get",
-            description="Get detailed info for a single asset by path",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Resource path (res://...)"}
-                },
-                "required": ["path"]
+        }
+    ),
+    Tool(
+        name="assets_random",
+        description="Get random assets matching filters - great for scattering varied objects",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "description": "Asset type filter"},
+                "pack": {"type": "string", "description": "Asset pack filter"},
+                "category": {"type": "string", "description": "Category filter"},
+                "count": {"type": "integer", "description": "Number of random assets (default 1)"}
             }
-        ),
-    ]
+        }
+    ),
+    Tool(
+        name="assets_list_packs",
+        description="List all detected asset packs with counts",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="assets_list_categories",
+        description="List all asset categories with counts",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="assets_get",
+        description="Get detailed info for a single asset by path",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Resource path (res://...)"}
+            },
+            "required": ["path"]
+        }
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    return _TOOLS
 
 
 # ============ Tool Handler ============
 
+# Live editor tools that map directly to a bridge endpoint
+_ENDPOINT_MAP: dict[str, str] = {
+    "godot_ping": "ping",
+    "godot_get_scene_tree": "scene/tree",
+    "godot_get_flat_nodes": "scene/tree/flat",
+    "godot_open_scene": "scene/open",
+    "godot_save_scene": "scene/save",
+    "godot_get_selected": "editor/selected",
+    "godot_select_nodes": "editor/select",
+    "godot_select_by_type": "editor/select/by_type",
+    "godot_select_by_group": "editor/select/by_group",
+    "godot_create_node": "node/create",
+    "godot_create_many_nodes": "node/create_many",
+    "godot_delete_node": "node/delete",
+    "godot_duplicate_node": "node/duplicate",
+    "godot_get_properties": "node/properties",
+    "godot_set_property": "node/set_property",
+    "godot_set_multiple_properties": "node/set_properties",
+    "godot_add_to_group": "node/add_to_group",
+    "godot_remove_from_group": "node/remove_from_group",
+    "godot_instantiate_scene": "scene/instantiate",
+    "godot_instantiate_many": "scene/instantiate_many",
+    "godot_get_terrain_height": "terrain/height",
+    "godot_get_terrain_heights": "terrain/heights",
+    "godot_scatter_objects": "placement/scatter",
+    "godot_place_along_path": "placement/along_path",
+    "godot_place_grid": "placement/grid",
+    "godot_batch_set_property": "batch/set_property",
+    "godot_batch_add_to_group": "batch/add_to_group",
+    "godot_batch_delete_by_type": "batch/delete_by_type",
+    "godot_batch_delete_by_group": "batch/delete_by_group",
+    "godot_batch_replace_mesh": "batch/replace_mesh",
+    "godot_search_nodes": "search/nodes",
+    "godot_find_by_type": "search/by_type",
+    "godot_find_by_group": "search/by_group",
+    "godot_find_by_name": "search/by_name",
+    "godot_list_scenes": "project/scenes",
+    "godot_list_scripts": "project/scripts",
+    "godot_run_scene": "debug/run_scene",
+    "godot_stop_running": "debug/stop",
+    "godot_get_debug_logs": "debug/logs",
+    "godot_clear_debug_logs": "debug/clear_logs",
+    "godot_get_viewport_screenshot": "viewport/screenshot",
+    "godot_execute": "execute",
+    "godot_execute_on_selected": "execute/on_selected",
+}
+
+# Offline analysis tools: handler(analyzer, arguments) -> result dict, or the
+# response text when the analyzer already encoded it
+_ANALYZE_DISPATCH: dict[str, Callable[[ProjectAnalyzer, dict], Any]] = {
+    "analyze_project_info": lambda a, args: a.get_project_info(),
+    "analyze_scan_scripts": lambda a, args: {"scripts": a.scan_all_scripts()},
+    "analyze_scan_scenes": lambda a, args: {"scenes": a.scan_all_scenes()},
+    "analyze_script": lambda a, args: a.analyze_script_json(args["script_path"]).decode('utf-8'),
+    "analyze_scene": lambda a, args: a.analyze_scene_json(args["scene_path"]).decode('utf-8'),
+    "analyze_find_nodes_by_type": lambda a, args: {"nodes": a.find_nodes_by_type(args["node_type"])},
+    "analyze_find_nodes_by_group": lambda a, args: {"nodes": a.find_nodes_by_group(args["group_name"])},
+    "analyze_find_script_usages": lambda a, args: {"usages": a.find_script_usages(args["search_term"])},
+    "analyze_find_signal_connections": lambda a, args: {"connections": a.find_signal_connections(args["signal_name"])},
+    "analyze_dependency_graph": lambda a, args: {"dependencies": a.get_dependency_graph()},
+    "analyze_find_orphans": lambda a, args: a.find_orphaned_resources(),
+    "analyze_search_in_files": lambda a, args: {"matches": a.search_in_files(args["pattern"], args.get("file_types"))},
+}
+
+def _dumps(result: Any) -> str:
+    """
+    Encode a tool result as indented JSON, with orjson when available.
+    Scan and dependency graph results get large, and orjson encodes them
+    several times faster than the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:  # e.g. integers beyond 64 bits, which json handles
+            pass
+    return json.dumps(result, indent=2)
+
+
+# Whole-project scans, re-walked and re-encoded on every call otherwise.
+# Queries over the in-memory indexes are cheaper than a fingerprint walk.
+_CACHED_ANALYZE_TOOLS = frozenset({"analyze_scan_scripts", "analyze_scan_scenes"})
+
+
+# Encoded results of _CACHED_ANALYZE_TOOLS (LRU):
+# (name, project path, fingerprint) -> JSON
+ANALYZE_CACHE_SIZE = 64
+_analyze_cache: OrderedDict[tuple[str, str, tuple], str] = OrderedDict()
+
+
+def _cached_analyze(name: str, analyzer: ProjectAnalyzer) -> str:
+    """
+    Encoded result of a cacheable analyze_* tool, computed with analyzer.
+    The fingerprint (ProjectAnalyzer.fingerprint) changes whenever a script,
+    scene or project.godot changes, so outdated entries are never hit.
+    """
+    key = (name, str(analyzer.project_path), _project_fingerprint(analyzer))
+    encoded = _analyze_cache.get(key)
+    if encoded is None:
+        encoded = _dumps(_ANALYZE_DISPATCH[name](analyzer, {}))
+        _analyze_cache[key] = encoded
+        while len(_analyze_cache) > ANALYZE_CACHE_SIZE:
+            _analyze_cache.popitem(last=False)
+    else:
+        _analyze_cache.move_to_end(key)
+    return encoded
+
+
+def _project_fingerprint(analyzer: ProjectAnalyzer) -> tuple:
+    """analyzer.fingerprint(), reused for FINGERPRINT_TTL seconds."""
+    global _fingerprint
+    now = time.monotonic()
+    if _fingerprint is None or _fingerprint[0] is not analyzer or now - _fingerprint[2] >= FINGERPRINT_TTL:
+        _fingerprint = (analyzer, analyzer.fingerprint(), now)
+    return _fingerprint[1]
+
+
+async def _handle_set_project(arguments: dict) -> dict:
+    global _active_project, _fingerprint
+    path = arguments["project_path"]
+    try:
+        os.stat(os.path.join(path, "project.godot"))  # One syscall, no Path objects
+    except OSError:
+        return {"error": f"No project.godot found in {path}"}
+    _active_project = Path(path).resolve()
+    _fingerprint = None
+    return {"success": True, "project": path}
+
+
+def _run_analyze(name: str, analyzer: ProjectAnalyzer, arguments: dict) -> Any:
+    if name in _CACHED_ANALYZE_TOOLS:
+        return _cached_analyze(name, analyzer)
+    return _ANALYZE_DISPATCH[name](analyzer, arguments)
+
+
+async def _handle_analyze(name: str, arguments: dict) -> Any:
+    analyzer = get_analyzer()
+    if not analyzer:
+        return {"error": "No project set. Use godot_set_project first."}
+    try:
+        # Scans and parses run in a worker thread so live tool calls keep
+        # flowing; the analyzer itself is not thread-safe, hence the lock
+        async with _analyzer_lock:
+            return await asyncio.to_thread(_run_analyze, name, analyzer, arguments)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# Asset tools: handler(scanner, arguments) -> result dict
+_ASSET_DISPATCH: dict[str, Callable[[AssetScanner, dict], Any]] = {
+    "assets_scan": lambda s, args: s.scan(
+        force=args.get("force", False),
+        exclude_addons=args.get("exclude_addons", False)
+    ),
+    "assets_search": lambda s, args: {"assets": s.search(
+        query=args.get("query"),
+        asset_type=args.get("type"),
+        pack=args.get("pack"),
+        category=args.get("category"),
+        tags=args.get("tags"),
+        limit=args.get("limit", 50)
+    )},
+    "assets_random": lambda s, args: {"assets": s.get_random(
+        asset_type=args.get("type"),
+        pack=args.get("pack"),
+        category=args.get("category"),
+        count=args.get("count", 1)
+    )},
+    "assets_list_packs": lambda s, args: {"packs": s.list_packs()},
+    "assets_list_categories": lambda s, args: {"categories": s.list_categories()},
+    "assets_get": lambda s, args: s.get_asset(args["path"]) or {"error": "Asset not found"},
+}
+
+
+async def _handle_assets(name: str, arguments: dict) -> dict:
+    scanner = get_asset_scanner()
+    if not scanner:
+        return {"error": "No project set. Use godot_set_project first."}
+    try:
+        async with _asset_scanner_lock:  # Same as _handle_analyze
+            return await asyncio.to_thread(_ASSET_DISPATCH[name], scanner, arguments)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def _handle_wait(arguments: dict) -> dict:
+    seconds = arguments.get("seconds", 2.0)
+    await asyncio.sleep(seconds)
+    return {"success": True, "waited": seconds}
+
+
+async def _call_live(endpoint: str, arguments: dict) -> dict:
+    return await call_godot(endpoint, arguments if arguments else None)
+
+
+async def _call_live_text(endpoint: str, arguments: dict) -> Any:
+    return await call_godot_text(endpoint, arguments if arguments else None)
+
+
+# Live tools whose response is returned as the plugin sent it. Screenshots
+# are unpacked into images and coalesced calls are split from batches, so
+# those need the parsed result.
+_PASSTHROUGH_TOOLS = frozenset(_ENDPOINT_MAP) - {
+    "godot_get_viewport_screenshot",
+    *(name for name, endpoint in _ENDPOINT_MAP.items() if endpoint in _COALESCERS),
+}
+
+
+# Every tool: handler(arguments) -> result dict, or already encoded text
+_HANDLERS: dict[str, Callable[[dict], Awaitable[Any]]] = {
+    "godot_set_project": _handle_set_project,
+    **{name: partial(_handle_analyze, name) for name in _ANALYZE_DISPATCH},
+    **{name: partial(_handle_assets, name) for name in _ASSET_DISPATCH},
+    "godot_game_ping": lambda args: call_runtime("ping"),
+    "godot_game_screenshot": lambda args: call_runtime("screenshot", args if args else None),
+    "godot_game_info": lambda args: call_runtime("info"),
+    "godot_wait": _handle_wait,
+    **{name: partial(_call_live_text if name in _PASSTHROUGH_TOOLS else _call_live, endpoint)
+       for name, endpoint in _ENDPOINT_MAP.items()},
+}
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
-    global _active_project
-    
-    result = {}
-    
-    # === Project Setup ===
-    if name == "godot_set_project":
-        path = arguments["project_path"]
-        if os.path.exists(os.path.join(path, "project.godot")):
-            _active_project = path
-            result = {"success": True, "project": path}
-        else:
-            result = {"error": f"No project.godot found in {path}"}
-    
-    # === Offline Analysis Tools ===
-    elif name.startswith("analyze_"):
-        analyzer = get_analyzer()
-        if not analyzer:
-            result = {"error": "No project set. Use godot_set_project first."}
-        else:
-            try:
-                if name == "analyze_project_info":
-                    result = analyzer.get_project_info()
-                elif name == "analyze_scan_scripts":
-                    result = {"scripts": analyzer.scan_all_scripts()}
-                elif name == "analyze_scan_scenes":
-                    result = {"scenes": analyzer.scan_all_scenes()}
-                elif name == "analyze_script":
-                    result = analyzer.analyze_script(arguments["script_path"])
-                elif name == "analyze_scene":
-                    result = analyzer.analyze_scene(arguments["scene_path"])
-                elif name == "analyze_find_nodes_by_type":
-                    result = {"nodes": analyzer.find_nodes_by_type(arguments["node_type"])}
-                elif name == "analyze_find_nodes_by_group":
-                    result = {"nodes": analyzer.find_nodes_by_group(arguments["group_name"])}
-                elif name == "analyze_find_script_usages":
-                    result = {"usages": analyzer.find_script_usages(arguments["search_term"])}
-                elif name == "analyze_find_signal_connections":
-                    result = {"connections": analyzer.find_signal_connections(arguments["signal_name"])}
-                elif name == "analyze_dependency_graph":
-                    result = {"dependencies": analyzer.get_dependency_graph()}
-                elif name == "analyze_find_orphans":
-                    result = analyzer.find_orphaned_resources()
-                elif name == "analyze_search_in_files":
-                    file_types = arguments.get("file_types")
-                    result = {"matches": analyzer.search_in_files(arguments["pattern"], file_types)}
-            except Exception as e:
-                result = {"error": str(e)}
-    
-    # === Asset Scanning Tools ===
-    elif name.startswith("assets_"):
-        scanner = get_asset_scanner()
-        if not scanner:
-            result = {"error": "No project set. Use godot_set_project first."}
-        else:
-            try:
-                if name == "assets_scan":
-                    force = arguments.get("force", False)
-                    exclude_addons = arguments.get("exclude_addons", False)
-                    result = scanner.scan(force=force, exclude_addons=exclude_addons)
-                elif name == "assets_search":
-                    result = {"assets": scanner.search(
-                        query=arguments.get("query"),
-                        asset_type=arguments.get("type"),
-                        pack=arguments.get("pack"),
-                        category=arguments.get("category"),
-                        tags=arguments.get("tags"),
-                        limit=arguments.get("limit", 50)
-                    )}
-                elif name == "assets_random":
-                    result = {"assets": scanner.get_random(
-                        asset_type=arguments.get("type"),
-                        pack=arguments.get("pack"),
-                        category=arguments.get("category"),
-                        count=arguments.get("count", 1)
-                    )}
-                elif name == "assets_list_packs":
-                    result = {"packs": scanner.list_packs()}
-                elif name == "assets_list_categories":
-                    result = {"categories": scanner.list_categories()}
-                elif name == "assets_get":
-                    result = scanner.get_asset(arguments["path"]) or {"error": "Asset not found"}
-            except Exception as e:
-                result = {"error": str(e)}
-    
-    # === Runtime Tools (Running Game) ===
-    elif name.startswith("godot_game_") or name == "godot_wait":
-        if name == "godot_game_ping":
-            result = await call_runtime("ping")
-        elif name == "godot_game_screenshot":
-            result = await call_runtime("screenshot", arguments if arguments else None)
-        elif name == "godot_game_info":
-            result = await call_runtime("info")
-        elif name == "godot_wait":
-            seconds = arguments.get("seconds", 2.0) if arguments else 2.0
-            await asyncio.sleep(seconds)
-            result = {"success": True, "waited": seconds}
-    
-    # === Live Godot Tools ===
+    handler = _HANDLERS.get(name)
+    if handler:
+        result = await handler(arguments or {})
     else:
-        # Map tool names to endpoints
-        endpoint_map = {
-            "godot_ping": "ping",
-            "godot_get_scene_tree": "scene/tree",
-            "godot_get_flat_nodes": "scene/tree/flat",
-            "godot_open_scene": "scene/open",
-            "godot_save_scene": "scene/save",
-            "godot_get_selected": "editor/selected",
-            "godot_select_nodes": "editor/select",
-            "godot_select_by_type": "editor/select/by_type",
-            "godot_select_by_group": "editor/select/by_group",
-            "godot_create_node": "node/create",
-            "godot_create_many_nodes": "node/create_many",
-            "godot_delete_node": "node/delete",
-            "godot_duplicate_node": "node/duplicate",
-            "godot_get_properties": "node/properties",
-            "godot_set_property": "node/set_property",
-            "godot_set_multiple_properties": "node/set_properties",
-            "godot_add_to_group": "node/add_to_group",
-            "godot_remove_from_group": "node/remove_from_group",
-            "godot_instantiate_scene": "scene/instantiate",
-            "godot_instantiate_many": "scene/instantiate_many",
-            "godot_get_terrain_height": "terrain/height",
-            "godot_get_terrain_heights": "terrain/heights",
-            "godot_scatter_objects": "placement/scatter",
-            "godot_place_along_path": "placement/along_path",
-            "godot_place_grid": "placement/grid",
-            "godot_batch_set_property": "batch/set_property",
-            "godot_batch_add_to_group": "batch/add_to_group",
-            "godot_batch_delete_by_type": "batch/delete_by_type",
-            "godot_batch_delete_by_group": "batch/delete_by_group",
-            "godot_batch_replace_mesh": "batch/replace_mesh",
-            "godot_search_nodes": "search/nodes",
-            "godot_find_by_type": "search/by_type",
-            "godot_find_by_group": "search/by_group",
-            "godot_find_by_name": "search/by_name",
-            "godot_list_scenes": "project/scenes",
-            "godot_list_scripts": "project/scripts",
-            "godot_run_scene": "debug/run_scene",
-            "godot_stop_running": "debug/stop",
-            "godot_get_debug_logs": "debug/logs",
-            "godot_clear_debug_logs": "debug/clear_logs",
-            "godot_get_viewport_screenshot": "viewport/screenshot",
-            "godot_execute": "execute",
-            "godot_execute_on_selected": "execute/on_selected",
-        }
-        
-        endpoint = endpoint_map.get(name)
-        if endpoint:
-            result = await call_godot(endpoint, arguments if arguments else None)
-        else:
-            result = {"error": f"Unknown tool: {name}"}
+        result = {"error": f"Unknown tool: {name}"}
+    
+    if isinstance(result, str):
+        # Already encoded (and cached)
+        return [TextContent(type="text", text=result)]
     
     # Special handling for screenshots - return as image
     if name in ("godot_get_viewport_screenshot", "godot_game_screenshot") and "image_base64" in result:
@@ -991,19 +1343,30 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
             ),
             TextContent(
                 type="text",
-                text=json.dumps({"width": result.get("width"), "height": result.get("height"), "success": True}, indent=2)
+                text=_dumps({"width": result.get("width"), "height": result.get("height"), "success": True})
             )
         ]
     
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    return [TextContent(type="text", text=_dumps(result))]
 
 
 # ============ Main ============
 
-async def main():
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+async def main() -> None:
+    # Create the shared bridge clients up front; every call reuses them
+    for base_url in (GODOT_BRIDGE_URL, GODOT_RUNTIME_URL):
+        get_http_client(base_url)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await close_http_clients()
+        if _analyzer is not None:
+            _analyzer.save_cache()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())